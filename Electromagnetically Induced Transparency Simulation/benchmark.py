@@ -0,0 +1,61 @@
+"""
+Benchmark of the sparse N-level Lindblad engine: steady-state solve time against
+the number of levels of a hyperfine Lambda scheme
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import argparse
+import time
+from typing import List
+import numpy as np
+from src.config import gamma, gamma_sg, Omega_p, Omega_c_on
+from src.level_scheme import hyperfine_scheme, build_liouvillian, sparse_steady_state
+
+
+def main(sublevels: List[int], method: str = "direct") -> None:
+    """
+    Builds and solves hyperfine schemes of growing size and prints a table of timings
+
+    Args:
+        sublevels (List[int]): Zeeman sublevels of each ground manifold
+        method (str, optional): sparse solver, "direct" or "iterative". Defaults to "direct"
+    """
+    print(f"{'levels':>8} {'nnz(L)':>10} {'build (s)':>10} {'solve (s)':>10} {'residual':>10}")
+    for n_ground in sublevels:
+        scheme = hyperfine_scheme(
+            n_ground, n_ground + 2, 0.1 * gamma, gamma, gamma_sg, Omega_p, Omega_c_on,
+            zeeman=0.05 * gamma)
+        start = time.perf_counter()
+        L = build_liouvillian(scheme)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rho = sparse_steady_state(L, method=method)
+        solve_time = time.perf_counter() - start
+
+        residual = np.abs(L @ rho.T.reshape(-1)).max()
+        print(
+            f"{len(scheme['levels']):>8} {L.nnz:>10} {build_time:>10.4f} "
+            f"{solve_time:>10.4f} {residual:>10.1e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Sparse N-level steady-state benchmark.")
+    parser.add_argument(
+        "--sublevels",
+        type=int,
+        nargs="+",
+        default=[1, 2, 5, 10, 20, 40, 66],
+        help="Zeeman sublevels per ground manifold (levels = 3 n + 2)"
+    )
+    parser.add_argument(
+        "--method",
+        choices=["direct", "iterative"],
+        default="direct",
+        help="Sparse steady-state solver (default value: direct)"
+    )
+    args = parser.parse_args()
+    main(args.sublevels, args.method)
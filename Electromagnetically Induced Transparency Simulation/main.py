@@ -5,26 +5,155 @@ Author: Ricard Santiago Raigada García
 Date: 06/12/2024
 Version: 0.0.1
 """
+import argparse
+import time
+from typing import Optional
+import numpy as np
 from src.calculations import calculate_susceptibility
-from src.config import gamma, gamma_sg, delta_p, Omega_p, Omega_c_on, Omega_c_off
+from src.cache import cached_susceptibility
+from src.adaptive import adaptive_susceptibility
+from src.doppler import doppler_susceptibility
+from src.results_store import ResultsWriter, SUSCEPTIBILITY_SCHEMA
+from src.config import (
+    gamma, gamma_sg, delta_p, Omega_p, Omega_c_on, Omega_c_off,
+    delta_p_min, delta_p_max, adaptive_tol,
+    doppler_width, n_velocity_classes, k_ratio, geometry,
+    cache_dir, cache_max_bytes, results_dir
+)
+from plots.plot_config import configure_plot_styles
 from plots.plot_generator import generate_plot, generate_imaginary_active_plot
+from plots.batch import render_batch
 
 
-def main() -> None:
+def main(
+    adaptive: bool = False,
+    doppler: bool = False,
+    cache: bool = True,
+    output_dir: Optional[str] = None,
+    results: bool = True
+) -> None:
     """
     Main function to calculate susceptibilities and generate plots.
+
+    Args:
+        adaptive (bool, optional): Sample the detuning on an adaptive grid
+        refined around the transparency window. Defaults to False
+        doppler (bool, optional): Average over the velocity classes of a warm
+        vapor. Defaults to False
+        cache (bool, optional): Reuse the curves cached on disk by previous runs
+        with the same parameters. Defaults to True
+        output_dir (str, optional): Render the figures headless to this
+        directory, in parallel, instead of showing them. Defaults to None
+        results (bool, optional): Append the curves, parameters, solve time and
+        provenance of the run to the Parquet dataset results_dir of
+        src/config.py. Defaults to True
     """
-    Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off = calculate_susceptibility(
-        delta_p, gamma, gamma_sg, Omega_p, Omega_c_on, Omega_c_off)
+    started = time.perf_counter()
+    cached = False
+    if doppler:
+        delta_p_grid = delta_p
+        rho_ge_on, rho_ge_off = (
+            doppler_susceptibility(
+                delta_p, gamma, gamma_sg, Omega_p, Omega_c, doppler_width,
+                k_ratio=k_ratio, geometry=geometry, n_classes=n_velocity_classes)
+            for Omega_c in (Omega_c_on, Omega_c_off)
+        )
+        Re_chi1_on, Im_chi1_on = rho_ge_on.real, rho_ge_on.imag
+        Re_chi1_off, Im_chi1_off = rho_ge_off.real, rho_ge_off.imag
+    elif adaptive:
+        delta_p_grid, Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off = adaptive_susceptibility(
+            gamma, gamma_sg, Omega_p, Omega_c_on, Omega_c_off,
+            delta_p_min, delta_p_max, tol=adaptive_tol)
+    elif cache:
+        delta_p_grid = delta_p
+        Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off = cached_susceptibility(
+            delta_p, gamma, gamma_sg, Omega_p, Omega_c_on, Omega_c_off,
+            cache_dir=cache_dir, max_bytes=cache_max_bytes)
+        # Curves are memory-mapped from the cache on a hit
+        cached = isinstance(Re_chi1_on, np.memmap)
+    else:
+        delta_p_grid = delta_p
+        Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off = calculate_susceptibility(
+            delta_p, gamma, gamma_sg, Omega_p, Omega_c_on, Omega_c_off)
+    solve_seconds = time.perf_counter() - started
+    if results:
+        method = "doppler" if doppler else "adaptive" if adaptive else "batched"
+        params = {
+            "delta_p": delta_p_grid, "gamma": gamma, "gamma_sg": gamma_sg, "Omega_p": Omega_p,
+            "Omega_c_on": Omega_c_on, "Omega_c_off": Omega_c_off, "method": method
+        }
+        with ResultsWriter(results_dir, SUSCEPTIBILITY_SCHEMA, params) as writer:
+            writer.append({
+                "method": [method] * 2,
+                "cached": [cached] * 2,
+                "control": ["on", "off"],
+                "gamma": [gamma] * 2,
+                "gamma_sg": [gamma_sg] * 2,
+                "Omega_p": [Omega_p] * 2,
+                "Omega_c": [Omega_c_on, Omega_c_off],
+                "delta_p": [delta_p_grid] * 2,
+                "chi_real": [Re_chi1_on, Re_chi1_off],
+                "chi_imag": [Im_chi1_on, Im_chi1_off],
+                "solve_seconds": [solve_seconds] * 2
+            })
+    if output_dir is not None:
+        render_batch([
+            {
+                "name": "susceptibility",
+                "figure": "full",
+                "args": (delta_p_grid, gamma, Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off)
+            },
+            {
+                "name": "susceptibility_imaginary_on",
+                "figure": "imaginary",
+                "args": (delta_p_grid, gamma, Im_chi1_on)
+            }
+        ], output_dir)
+        return
+    configure_plot_styles()
     generate_plot(
-        delta_p,
+        delta_p_grid,
         gamma,
         Re_chi1_on,
         Im_chi1_on,
         Re_chi1_off,
         Im_chi1_off)
-    generate_imaginary_active_plot(delta_p, gamma, Im_chi1_on)
+    generate_imaginary_active_plot(delta_p_grid, gamma, Im_chi1_on)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(
+        description="EIT first-order susceptibility.")
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Use an adaptive detuning grid refined around the transparency window"
+    )
+    parser.add_argument(
+        "--doppler",
+        action="store_true",
+        help="Average over the Maxwell-Boltzmann velocity classes of a warm vapor"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute the susceptibility instead of reusing the on-disk cache"
+    )
+    parser.add_argument(
+        "--output_dir",
+        type=str,
+        default=None,
+        help="Save the figures to this directory without opening windows"
+    )
+    parser.add_argument(
+        "--no-results",
+        action="store_true",
+        help="Do not append the curves of the run to the Parquet results dataset"
+    )
+    args = parser.parse_args()
+    main(
+        adaptive=args.adaptive,
+        doppler=args.doppler,
+        cache=not args.no_cache,
+        output_dir=args.output_dir,
+        results=not args.no_results)
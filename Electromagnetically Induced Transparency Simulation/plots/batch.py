@@ -0,0 +1,135 @@
+"""
+This module renders families of susceptibility figures headless, straight to
+image files, spreading the figures over a pool of worker processes
+
+Every job is a dictionary with the keys:
+    "name": file name of the figure, without extension
+    "figure": one of FIGURES
+    "args": positional arguments of the matching function of plots/plot_generator.py
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import matplotlib
+import numpy as np
+from plots.decimation import DEFAULT_MAX_POINTS
+from plots.plot_config import configure_plot_styles
+from plots.plot_generator import generate_plot, generate_imaginary_active_plot
+
+FIGURES: Tuple[str, ...] = ("full", "imaginary")
+
+Job = Dict[str, Any]
+
+
+def _init_worker() -> None:
+    """
+    Selects the non-interactive backend and the plot styles once per worker
+    """
+    matplotlib.use("Agg")
+    configure_plot_styles()
+
+
+def render_figure(
+    job: Job,
+    output_dir: str,
+    fmt: str = "png",
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    decimation: str = "lttb"
+) -> str:
+    """
+    Renders one job to an image file
+
+    Args:
+        job (Job): figure description
+        output_dir (str): directory of the image files
+        fmt (str, optional): image format. Defaults to "png"
+        max_points (int, optional): points plotted per curve. Defaults to DEFAULT_MAX_POINTS
+        decimation (str, optional): "lttb" or "minmax". Defaults to "lttb"
+
+    Returns:
+        str: path of the image file
+    """
+    if job["figure"] not in FIGURES:
+        raise ValueError(f"Unknown figure '{job['figure']}', expected one of {FIGURES}")
+    output = os.path.join(output_dir, f"{job['name']}.{fmt}")
+    generator = generate_plot if job["figure"] == "full" else generate_imaginary_active_plot
+    generator(*job["args"], max_points=max_points, decimation=decimation, output=output)
+    return output
+
+
+def render_batch(
+    jobs: List[Job],
+    output_dir: str,
+    n_workers: Optional[int] = None,
+    fmt: str = "png",
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    decimation: str = "lttb"
+) -> List[str]:
+    """
+    Renders a list of jobs to image files in parallel
+
+    Args:
+        jobs (List[Job]): figure descriptions
+        output_dir (str): directory of the image files
+        n_workers (int, optional): worker processes; None uses os.cpu_count(),
+            1 renders in the current process. Defaults to None
+        fmt (str, optional): image format. Defaults to "png"
+        max_points (int, optional): points plotted per curve. Defaults to DEFAULT_MAX_POINTS
+        decimation (str, optional): "lttb" or "minmax". Defaults to "lttb"
+
+    Returns:
+        List[str]: paths of the image files, in the order of the jobs
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    options = (output_dir, fmt, max_points, decimation)
+    if n_workers == 1:
+        _init_worker()
+        return [render_figure(job, *options) for job in jobs]
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(render_figure, job, *options) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def susceptibility_jobs(
+    delta_p: np.ndarray,
+    gamma: float,
+    Omega_c: np.ndarray,
+    chi: np.ndarray,
+    reference: int = 0,
+    prefix: str = "chi"
+) -> List[Job]:
+    """
+    Builds the figure family of a control sweep: one full figure per control
+    setting against the reference setting (control OFF) and one imaginary-part
+    figure per setting
+
+    Args:
+        delta_p (np.ndarray): Single-photon detunings
+        gamma (float): Decay rate
+        Omega_c (np.ndarray): control settings, as in SusceptibilityCurves
+        chi (np.ndarray): complex susceptibility of shape (len(Omega_c), len(delta_p))
+        reference (int, optional): index of the control OFF curve. Defaults to 0
+        prefix (str, optional): prefix of the file names. Defaults to "chi"
+
+    Returns:
+        List[Job]: figure descriptions
+    """
+    off = chi[reference]
+    jobs = []
+    for omega_c, on in zip(Omega_c, chi):
+        tag = f"{prefix}_Omega_c_{omega_c:g}"
+        jobs.append({
+            "name": tag,
+            "figure": "full",
+            "args": (delta_p, gamma, on.real, on.imag, off.real, off.imag)
+        })
+        jobs.append({
+            "name": f"{tag}_imaginary",
+            "figure": "imaginary",
+            "args": (delta_p, gamma, on.imag)
+        })
+    return jobs
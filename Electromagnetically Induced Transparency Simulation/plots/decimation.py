@@ -0,0 +1,115 @@
+"""
+This module reduces long curves to a few thousand points before they are
+plotted, preserving their visual shape
+
+- "lttb": Largest-Triangle-Three-Buckets keeps, from every bucket, the point
+  forming the largest triangle with the point kept from the previous bucket and
+  the average of the next one
+- "minmax": keeps the minimum and the maximum of every bin, so no peak or dip is
+  ever lost
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from typing import Tuple
+import numpy as np
+
+DECIMATION_METHODS: Tuple[str, ...] = ("lttb", "minmax")
+
+# Points kept per curve by default, well above the horizontal resolution of a figure
+DEFAULT_MAX_POINTS: int = 4000
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets decimation
+
+    Args:
+        x (np.ndarray): sorted abscissas
+        y (np.ndarray): ordinates
+        n_out (int): number of points to keep, at least 3
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: decimated x and y
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    # The first and last points are always kept, the rest is split in n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # Average of every bucket, used as the third vertex of the triangles
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    mean_x = np.append(sums_x / counts, x[-1])
+    mean_y = np.append(sums_y / counts, y[-1])
+
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for k in range(n_out - 2):
+        lo, hi = edges[k], edges[k + 1]
+        area = np.abs(
+            (x[a] - mean_x[k + 1]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (mean_y[k + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[k + 1] = a
+    return x[keep], y[keep]
+
+
+def minmax(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max binning: keeps the extremes of (n_out - 2) / 2 bins and the end
+    points, in their original order
+
+    Args:
+        x (np.ndarray): sorted abscissas
+        y (np.ndarray): ordinates
+        n_out (int): number of points to keep
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: decimated x and y
+    """
+    n = len(x)
+    n_bins = (n_out - 2) // 2
+    if n_out >= n or n_bins < 1:
+        return x, y
+    width = -(-n // n_bins)
+    padded = np.full(n_bins * width, np.nan)
+    padded[:n] = y
+    bins = padded.reshape(n_bins, width)
+    offsets = np.arange(n_bins) * width
+    # Rounding the bin width up may leave trailing bins without any point
+    used = offsets < n
+    lows = offsets[used] + np.nanargmin(bins[used], axis=1)
+    highs = offsets[used] + np.nanargmax(bins[used], axis=1)
+    keep = np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+    return x[keep], y[keep]
+
+
+def decimate(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int = DEFAULT_MAX_POINTS,
+    method: str = "lttb"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decimates a curve to at most max_points points
+
+    Args:
+        x (np.ndarray): sorted abscissas
+        y (np.ndarray): ordinates
+        max_points (int, optional): points to keep. Defaults to DEFAULT_MAX_POINTS
+        method (str, optional): one of DECIMATION_METHODS. Defaults to "lttb"
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: decimated x and y
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {DECIMATION_METHODS}")
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if method == "lttb":
+        return lttb(x, y, max_points)
+    return minmax(x, y, max_points)
@@ -5,37 +5,72 @@ Author: Ricard Santiago Raigada García
 Date: 06/12/2024
 Version: 0.0.1
 """
+import numpy as np
 
-def get_annotations() -> list:
+
+def _anchor(x: np.ndarray, y: np.ndarray, feature: str) -> tuple:
+    """
+    Finds the point of a curve an annotation arrow points to
+
+    Args:
+        x (np.ndarray): abscissas of the curve
+        y (np.ndarray): ordinates of the curve
+        feature (str): "wing" for the point at 70% of the positive detuning
+            range, "half-maximum" for the half-height point of the highest peak
+            at positive detuning: on its falling edge for a peak at the line
+            centre, on its rising edge for a transparency dip
+
+    Returns:
+        tuple: (x, y) of the anchor
     """
-    Returns a list of annotations for the plot
+    if feature == "half-maximum":
+        start = int(np.argmin(np.abs(x)))
+        peak = start + int(np.argmax(y[start:]))
+        edge = np.arange(start, peak + 1) if peak > start + 1 else np.arange(peak, len(y))
+        level = 0.5 * (y[peak] + y[edge].min())
+        i = int(edge[np.argmin(np.abs(y[edge] - level))])
+    else:
+        i = int(np.argmin(np.abs(x - 0.7 * x.max())))
+    return float(x[i]), float(y[i])
+
+
+def get_annotations(
+    x: np.ndarray,
+    Re_chi1_on: np.ndarray,
+    Im_chi1_on: np.ndarray,
+    Re_chi1_off: np.ndarray,
+    Im_chi1_off: np.ndarray
+) -> list:
+    """
+    Returns a list of annotations for the plot, placed from the plotted data:
+    the real parts are labelled on their wings and the imaginary parts at the
+    right half-maximum of the absorption line, with the labels of the control
+    OFF curves above them and those of the control ON curves below
+
+    Args:
+        x (np.ndarray): plotted detunings
+        Re_chi1_on, Im_chi1_on: Real and imaginary parts of susceptibility (control ON)
+        Re_chi1_off, Im_chi1_off: Real and imaginary parts of susceptibility (control OFF)
 
     Returns:
         list: A list of dictionaries containing annotation
     """
-    return [
-        {
-            'text': 'Re[$\\chi^{(1)}$] (Control OFF)',
-            'xy': (2.129, 0.0477),
-            'xytext': (2.529, 0.0577),
-            'color': '#646464'
-        },
-        {
-            'text': 'Im[$\\chi^{(1)}$] (Control OFF)',
-            'xy': (0.461, 0.122),
-            'xytext': (0.603, 0.1353),
-            'color': '#878787'
-        },
-        {
-            'text': 'Re[$\\chi^{(1)}$] (Control ON)',
-            'xy': (2.143, 0.0332),
-            'xytext': (2.535, 0.0160),
-            'color': '#1f77b4'
-        },
-        {
-            'text': 'Im[$\\chi^{(1)}$] (Control ON)',
-            'xy': (0.400, 0.0047),
-            'xytext': (0.603, -0.0340),
-            'color': '#ff7f0e'
-        }
+    x = np.asarray(x)
+    curves = [
+        ('Re[$\\chi^{(1)}$] (Control OFF)', Re_chi1_off, 'wing', 1, '#646464'),
+        ('Im[$\\chi^{(1)}$] (Control OFF)', Im_chi1_off, 'half-maximum', 1, '#878787'),
+        ('Re[$\\chi^{(1)}$] (Control ON)', Re_chi1_on, 'wing', -1, '#1f77b4'),
+        ('Im[$\\chi^{(1)}$] (Control ON)', Im_chi1_on, 'half-maximum', -1, '#ff7f0e')
     ]
+    span_x = x.max() - x.min()
+    span_y = max(np.ptp(np.asarray(y)) for _, y, _, _, _ in curves)
+    annotations = []
+    for text, y, feature, side, color in curves:
+        xy = _anchor(x, np.asarray(y), feature)
+        annotations.append({
+            'text': text,
+            'xy': xy,
+            'xytext': (xy[0] + 0.065 * span_x, xy[1] + side * 0.08 * span_y),
+            'color': color
+        })
+    return annotations
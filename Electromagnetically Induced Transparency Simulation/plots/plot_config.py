@@ -7,11 +7,21 @@ Version: 0.0.1
 """
 import matplotlib.pyplot as plt
 
+_configured: bool = False
 
-def configure_plot_styles() -> None:
+
+def configure_plot_styles(force: bool = False) -> None:
     """
-    Configures global styles for all plots
+    Configures global styles for all plots. The styles are applied once per
+    process; later calls return immediately
+
+    Args:
+        force (bool, optional): apply the styles again. Defaults to False
     """
+    global _configured
+    if _configured and not force:
+        return
+    _configured = True
     plt.rcParams.update({
         'font.family': 'DejaVu Serif',
         'font.size': 12,
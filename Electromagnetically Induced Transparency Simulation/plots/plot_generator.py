@@ -7,9 +7,11 @@ Date: 06/12/2024
 Version: 0.0.1
 """
 from typing import List, Dict, Optional
+import numpy as np
 import matplotlib.pyplot as plt
 from plots.plot_config import configure_plot_styles
 from plots.plot_annotations import get_annotations
+from plots.decimation import DEFAULT_MAX_POINTS, decimate
 
 
 def configure_ax(ax: plt.Axes,
@@ -63,6 +65,43 @@ def add_annotations(ax: plt.Axes,
             arrowprops={"arrowstyle": '->', "color": ann['color']})
 
 
+def _decimated(x: np.ndarray,
+               y: List[float],
+               max_points: Optional[int],
+               method: str
+               ) -> tuple:
+    """
+    Decimates a curve unless max_points is None
+
+    Args:
+        x (np.ndarray): Abscissas
+        y (list): Ordinates
+        max_points (int, optional): Points to keep
+        method (str): Decimation method
+
+    Returns:
+        tuple: x and y to plot
+    """
+    if max_points is None:
+        return x, y
+    return decimate(x, y, max_points, method)
+
+
+def finish_figure(fig: plt.Figure, output: Optional[str]) -> None:
+    """
+    Shows a figure, or saves it to a file and closes it in headless runs
+
+    Args:
+        fig (matplotlib.figure.Figure): The figure
+        output (str, optional): Path of the image file. Defaults to showing the figure
+    """
+    if output is None:
+        plt.show()
+    else:
+        fig.savefig(output, bbox_inches='tight')
+        plt.close(fig)
+
+
 def generate_plot(
     delta_p: List[float],
     gamma: float,
@@ -70,6 +109,9 @@ def generate_plot(
     Im_chi1_on: List[float],
     Re_chi1_off: List[float],
     Im_chi1_off: List[float],
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    decimation: str = "lttb",
+    output: Optional[str] = None
 ) -> None:
     """
     Generates a full plot with active and inactive control laser states.
@@ -79,35 +121,27 @@ def generate_plot(
         gamma (float): Decay rate
         Re_chi1_on, Im_chi1_on: Real and imaginary parts of susceptibility (control ON)
         Re_chi1_off, Im_chi1_off: Real and imaginary parts of susceptibility (control OFF)
+        max_points (int, optional): Points plotted per curve, None plots every
+            point. Defaults to DEFAULT_MAX_POINTS
+        decimation (str, optional): "lttb" or "minmax". Defaults to "lttb"
+        output (str, optional): Path of the image file. Defaults to showing the figure
     """
     configure_plot_styles()
-    annotations = get_annotations()
+    x = np.asarray(delta_p) / gamma
+    annotations = get_annotations(x, Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off)
     fig, ax = plt.subplots(figsize=(12, 10))
 
-    ax.plot(
-        delta_p / gamma,
-        Re_chi1_on,
-        label='Re[$\\chi^{(1)}$] (Control ON)',
-        color='#1f77b4',
-        linestyle='-')
-    ax.plot(
-        delta_p / gamma,
-        Im_chi1_on,
-        label='Im[$\\chi^{(1)}$] (Control ON)',
-        color='#ff7f0e',
-        linestyle='-')
-    ax.plot(
-        delta_p / gamma,
-        Re_chi1_off,
-        label='Re[$\\chi^{(1)}$] (Control OFF)',
-        color='#646464',
-        linestyle='--')
-    ax.plot(
-        delta_p / gamma,
-        Im_chi1_off,
-        label='Im[$\\chi^{(1)}$] (Control OFF)',
-        color='#878787',
-        linestyle='--')
+    for y, label, color, linestyle in (
+        (Re_chi1_on, 'Re[$\\chi^{(1)}$] (Control ON)', '#1f77b4', '-'),
+        (Im_chi1_on, 'Im[$\\chi^{(1)}$] (Control ON)', '#ff7f0e', '-'),
+        (Re_chi1_off, 'Re[$\\chi^{(1)}$] (Control OFF)', '#646464', '--'),
+        (Im_chi1_off, 'Im[$\\chi^{(1)}$] (Control OFF)', '#878787', '--')
+    ):
+        ax.plot(
+            *_decimated(x, y, max_points, decimation),
+            label=label,
+            color=color,
+            linestyle=linestyle)
 
     configure_ax(
         ax,
@@ -124,13 +158,16 @@ def generate_plot(
         frameon=False,
         title_fontsize=14
     )
-    plt.show()
+    finish_figure(fig, output)
 
 
 def generate_imaginary_active_plot(
     delta_p: List[float],
     gamma: float,
-    Im_chi1_on: List[float]
+    Im_chi1_on: List[float],
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    decimation: str = "lttb",
+    output: Optional[str] = None
 ) -> None:
     """
     Generates the plot for the imaginary part of susceptibility with the control laser ON.
@@ -139,13 +176,16 @@ def generate_imaginary_active_plot(
         delta_p (np.array): Detuning of a single photon
         gamma (float): Decay rate
         Im_chi1_on (list): Imaginary part of susceptibility (control ON)
+        max_points (int, optional): Points plotted, None plots every point.
+            Defaults to DEFAULT_MAX_POINTS
+        decimation (str, optional): "lttb" or "minmax". Defaults to "lttb"
+        output (str, optional): Path of the image file. Defaults to showing the figure
     """
     configure_plot_styles()
     fig, ax = plt.subplots(figsize=(10, 6))
 
     ax.plot(
-        delta_p / gamma,
-        Im_chi1_on,
+        *_decimated(np.asarray(delta_p) / gamma, Im_chi1_on, max_points, decimation),
         label='Im[$\\chi^{(1)}$] (Control ON)',
         color='#ff7f0e',
         linestyle='-')
@@ -162,4 +202,4 @@ def generate_imaginary_active_plot(
         frameon=False,
         title_fontsize=14
     )
-    plt.show()
+    finish_figure(fig, output)
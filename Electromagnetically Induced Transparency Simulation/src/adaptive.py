@@ -0,0 +1,111 @@
+"""
+This module samples the susceptibility on an adaptive detuning grid. It starts
+from a coarse uniform grid and bisects the intervals where the curve deviates
+from a straight line, so points concentrate in the narrow transparency window
+instead of the flat wings
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from typing import Callable, Tuple
+import numpy as np
+from src.liouvillian import steady_state_coherence
+
+
+def adaptive_detuning_grid(
+    fn: Callable[[np.ndarray], np.ndarray],
+    start: float,
+    stop: float,
+    n_initial: int = 33,
+    tol: float = 1e-4,
+    max_points: int = 4001
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Refines a detuning grid until linear interpolation between neighbours
+    reproduces fn at every interval midpoint within tol. When the grid would
+    exceed max_points, the intervals with the largest deviation are refined first
+
+    Args:
+        fn (Callable[[np.ndarray], np.ndarray]): maps detunings of shape (n,)
+            to complex values of shape (..., n)
+        start (float): first detuning
+        stop (float): last detuning
+        n_initial (int, optional): points of the initial uniform grid. Defaults to 33
+        tol (float, optional): absolute tolerance on Re and Im. Defaults to 1e-4
+        max_points (int, optional): upper bound on the grid size. Defaults to 4001
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            sorted non-uniform detuning grid
+            values of fn on the grid, detuning on the last axis
+    """
+    x = np.linspace(start, stop, n_initial)
+    y = np.asarray(fn(x))
+    # Midpoint deviation of every interval, unknown until it is bisected
+    error = np.full(len(x) - 1, np.inf)
+
+    while (error > tol).any() and len(x) < max_points:
+        intervals = np.flatnonzero(error > tol)
+        budget = max_points - len(x)
+        if len(intervals) > budget:
+            worst = np.argsort(-error[intervals], kind="stable")[:budget]
+            intervals = np.sort(intervals[worst])
+        x_mid = 0.5 * (x[intervals] + x[intervals + 1])
+        y_mid = np.asarray(fn(x_mid))
+        y_lin = 0.5 * (y[..., intervals] + y[..., intervals + 1])
+        deviation = np.maximum(
+            np.abs(y_mid.real - y_lin.real),
+            np.abs(y_mid.imag - y_lin.imag)
+        ).reshape(-1, len(intervals)).max(axis=0)
+
+        # Both halves of a bisected interval inherit its deviation, so those
+        # that missed the tolerance are checked again
+        x = np.insert(x, intervals + 1, x_mid)
+        y = np.insert(y, intervals + 1, y_mid, axis=-1)
+        error = np.insert(error, intervals + 1, deviation)
+        left = intervals + np.arange(len(intervals))
+        error[left] = deviation
+    return x, y
+
+
+def adaptive_susceptibility(
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c_on: float,
+    Omega_c_off: float,
+    start: float,
+    stop: float,
+    tol: float = 1e-4,
+    n_initial: int = 33,
+    max_points: int = 4001
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the susceptibility with control ON and OFF on one shared adaptive grid,
+    refined wherever any of the four curves needs it
+
+    Args:
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c_on (float): Rabi frequency of the control laser (ON state)
+        Omega_c_off (float): Rabi frequency of the control laser (OFF state)
+        start (float): first detuning
+        stop (float): last detuning
+        tol (float, optional): absolute tolerance on Re and Im. Defaults to 1e-4
+        n_initial (int, optional): points of the initial uniform grid. Defaults to 33
+        max_points (int, optional): upper bound on the grid size. Defaults to 4001
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            delta_p: non-uniform detuning grid
+            Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off: as in calculate_susceptibility
+    """
+    Omega_c = np.array([Omega_c_on, Omega_c_off])[:, None]
+
+    def coherence(dp: np.ndarray) -> np.ndarray:
+        return steady_state_coherence(dp[None, :], gamma, gamma_sg, Omega_p, Omega_c)
+
+    delta_p, rho_ge = adaptive_detuning_grid(coherence, start, stop, n_initial, tol, max_points)
+    return delta_p, rho_ge[0].real, rho_ge[0].imag, rho_ge[1].real, rho_ge[1].imag
@@ -0,0 +1,150 @@
+"""
+This module caches the outputs of calculate_susceptibility on disk, so that
+changes to the plots do not pay the solver cost again
+
+Entries are content-addressed: the file name is a SHA-256 hash of the detuning
+grid, the physical parameters, the solver method and SOLVER_VERSION, so any
+change of inputs or of the solvers misses the cache instead of returning stale
+curves. Every entry is a single .npy file holding the four curves, which is
+memory-mapped on load. The least recently used entries are evicted once the
+cache exceeds its size budget
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from src.calculations import SOLVER_VERSION, calculate_susceptibility
+
+# Default size budget of the cache directory
+MAX_CACHE_BYTES: int = 256 * 2 ** 20
+
+
+def cache_key(params: Dict[str, Any]) -> str:
+    """
+    Hashes a dictionary of parameters together with SOLVER_VERSION. Arrays are
+    hashed by dtype, shape and content
+
+    Args:
+        params (Dict[str, Any]): scalars, strings or arrays
+
+    Returns:
+        str: hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256(SOLVER_VERSION.encode())
+    for name in sorted(params):
+        value = params[name]
+        digest.update(name.encode())
+        if isinstance(value, np.ndarray):
+            array = np.ascontiguousarray(value)
+            digest.update(f"{array.dtype.str}{array.shape}".encode())
+            digest.update(array.tobytes())
+        else:
+            digest.update(json.dumps(value).encode())
+    return digest.hexdigest()
+
+
+def _entries(cache_dir: str) -> List[Tuple[float, int, str]]:
+    """
+    Lists the cache entries
+
+    Args:
+        cache_dir (str): directory of the cache
+
+    Returns:
+        List[Tuple[float, int, str]]: last access time, size and path of every entry
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".npy"):
+            path = os.path.join(cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def evict(cache_dir: str, max_bytes: int = MAX_CACHE_BYTES) -> int:
+    """
+    Removes the least recently used entries until the cache fits in max_bytes
+
+    Args:
+        cache_dir (str): directory of the cache
+        max_bytes (int, optional): size budget. Defaults to MAX_CACHE_BYTES
+
+    Returns:
+        int: number of removed entries
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+    entries = sorted(_entries(cache_dir))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+        removed += 1
+    return removed
+
+
+def cached_susceptibility(
+    delta_p: np.ndarray,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c_on: float,
+    Omega_c_off: float,
+    method: str = "batched",
+    cache_dir: str = "cache",
+    max_bytes: int = MAX_CACHE_BYTES
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    calculate_susceptibility backed by the on-disk cache
+
+    Args:
+        delta_p (numpy.ndarray): Single-photon detunings
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c_on (float): Rabi frequency of the control laser (ON state)
+        Omega_c_off (float): Rabi frequency of the control laser (OFF state)
+        method (str, optional): solver of calculate_susceptibility. Defaults to "batched"
+        cache_dir (str, optional): directory of the cache. Defaults to "cache"
+        max_bytes (int, optional): size budget of the cache. Defaults to MAX_CACHE_BYTES
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off, memory-mapped on a hit
+    """
+    delta_p = np.asarray(delta_p, dtype=float)
+    key = cache_key({
+        "delta_p": delta_p,
+        "gamma": float(gamma),
+        "gamma_sg": float(gamma_sg),
+        "Omega_p": float(Omega_p),
+        "Omega_c_on": float(Omega_c_on),
+        "Omega_c_off": float(Omega_c_off),
+        "method": method
+    })
+    path = os.path.join(cache_dir, f"{key}.npy")
+    if os.path.exists(path):
+        # Refresh the access time used by the eviction order
+        os.utime(path)
+        curves = np.load(path, mmap_mode="r")
+        return curves[0], curves[1], curves[2], curves[3]
+
+    curves = np.stack(calculate_susceptibility(
+        delta_p, gamma, gamma_sg, Omega_p, Omega_c_on, Omega_c_off, method=method))
+    os.makedirs(cache_dir, exist_ok=True)
+    # Written under a temporary name and renamed, so readers never see partial entries
+    tmp_path = os.path.join(cache_dir, f"{key}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, curves)
+    os.replace(tmp_path, path)
+    evict(cache_dir, max_bytes)
+    return curves[0], curves[1], curves[2], curves[3]
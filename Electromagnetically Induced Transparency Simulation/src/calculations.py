@@ -6,84 +6,134 @@ Author: Ricard Santiago Raigada García
 Date: 06/12/2024
 Version: 0.0.1
 """
-from typing import Tuple, List
+from typing import NamedTuple, Sequence, Tuple
 import numpy as np
 from qutip import steadystate, basis
+from src.liouvillian import G, E, N_LEVELS, build_liouvillians, liouvillian_terms, steady_state_coherence
+from src.continuation import batched_continuation
 
+SOLVERS: Tuple[str, ...] = ("batched", "continuation", "qutip")
+# Part of the cache keys of src/cache.py: bump it whenever the solvers change their results
+SOLVER_VERSION: str = "0.0.1"
 
-def calculate_susceptibility(
+
+class SusceptibilityCurves(NamedTuple):
+    """
+    Complex first-order susceptibility labelled by control setting (axis 0) and
+    detuning (axis 1)
+    """
+    Omega_c: np.ndarray
+    delta_p: np.ndarray
+    chi: np.ndarray
+
+    def sel(self, Omega_c: float) -> np.ndarray:
+        """
+        Returns the curve of the control setting closest to Omega_c
+
+        Args:
+            Omega_c (float): Rabi frequency of the control laser
+
+        Returns:
+            np.ndarray: complex susceptibility along the detuning axis
+        """
+        return self.chi[int(np.argmin(np.abs(self.Omega_c - Omega_c)))]
+
+
+def calculate_susceptibilities(
     delta_p: np.ndarray,
     gamma: float,
     gamma_sg: float,
     Omega_p: float,
-    Omega_c_on: float,
-    Omega_c_off: float
-) -> Tuple[List[float], List[float], List[float], List[float]]:
+    Omega_c: Sequence[float],
+    method: str = "batched"
+) -> SusceptibilityCurves:
     """
-    Computes the real and imaginary part of the first-order susceptibility
+    Computes the first-order susceptibility for a list of control settings in one
+    stacked pass
 
     Args:
         delta_p (numpy.ndarray): Single-photon detunings
         gamma (float): Decay rate of the excited state
         gamma_sg (float): Decay rate of the metastable state
         Omega_p (float): Rabi frequency of the probe field
-        Omega_c_on (float): Rabi frequency of the control laser (ON state)
-        Omega_c_off (float): Rabi frequency of the control laser (OFF state)
+        Omega_c (Sequence[float]): Rabi frequencies of the control laser
+        method (str, optional): "batched" solves every (control, detuning) pair
+            as stacked NumPy systems, "continuation" eigen-decomposes every
+            control setting once and covers the detuning axis by continuation,
+            "qutip" calls steadystate once per pair. Defaults to "batched"
 
     Returns:
-        Tuple[List[float], List[float], List[float], List[float]]:
-            Re_chi1_on: Real part of susceptibility (Control ON).
-            Im_chi1_on: Imaginary part of susceptibility (Control ON).
-            Re_chi1_off: Real part of susceptibility (Control OFF).
-            Im_chi1_off: Imaginary part of susceptibility (Control OFF).
+        SusceptibilityCurves: complex susceptibility of shape (len(Omega_c), len(delta_p))
     """
-    Re_chi1_on, Im_chi1_on = [], []
-    Re_chi1_off, Im_chi1_off = [], []
+    if method not in SOLVERS:
+        raise ValueError(f"Unknown method '{method}', expected one of {SOLVERS}")
+    delta_p = np.asarray(delta_p, dtype=float)
+    Omega_c = np.atleast_1d(np.asarray(Omega_c, dtype=float))
+    if method == "batched":
+        chi = steady_state_coherence(delta_p[None, :], gamma, gamma_sg, Omega_p, Omega_c[:, None])
+        return SusceptibilityCurves(Omega_c, delta_p, chi)
+    if method == "continuation":
+        L0 = build_liouvillians(
+            Omega_p=Omega_p, Omega_c=Omega_c, gamma=gamma, gamma_sg=gamma_sg)
+        chi = batched_continuation(
+            L0, liouvillian_terms()["delta_p"], delta_p, component=E * N_LEVELS + G)
+        return SusceptibilityCurves(Omega_c, delta_p, chi)
 
     # States of the Lambda system
     g = basis(3, 0)
     e = basis(3, 1)
     s = basis(3, 2)
 
-    proj_g = g * g.dag()
-    proj_e = e * e.dag()
-    proj_s = s * s.dag()
-    sigma_ge = g * e.dag()
-    sigma_eg = e * g.dag()
-    sigma_se = s * e.dag()
-    sigma_es = e * s.dag()
-    sigma_gs = g * s.dag()
-    sigma_sg = s * g.dag()
+    # Operator algebra hoisted out of the loop: H = dp * H_dp + Omega_c * H_c + H_p
+    H_dp = s * s.dag() - e * e.dag()  # Two-photon resonance
+    H_p = Omega_p * (e * g.dag() + g * e.dag())
+    H_c = e * s.dag() + s * e.dag()
 
     # Spontaneous decay
     c_ops = [
-        np.sqrt(gamma) * sigma_ge,
-        np.sqrt(gamma_sg) * sigma_gs
+        np.sqrt(gamma) * g * e.dag(),
+        np.sqrt(gamma_sg) * g * s.dag()
     ]
 
-    # Iterate over detunings for control ON
-    for dp in delta_p:
-        H_on = (
-            -dp * proj_e
-            + (dp - 0.0) * proj_s  # Two-photon resonance
-            + Omega_p * (sigma_eg + sigma_ge)
-            + Omega_c_on * (sigma_es + sigma_se)
-        )
-        # Steady state
-        rho_ss_on = steadystate(H_on, c_ops)
-        rho_ge_on = rho_ss_on.matrix_element(g.dag(), e)
-        Re_chi1_on.append(np.real(rho_ge_on))
-        Im_chi1_on.append(np.imag(rho_ge_on))
-
-    # Detunings for control OFF
-    for dp in delta_p:
-        H_off = (
-            -dp * proj_e
-            + (dp - 0.0) * proj_s
-            + Omega_p * (sigma_eg + sigma_ge)
-        )
-        rho_ss_off = steadystate(H_off, c_ops)
-        rho_ge_off = rho_ss_off.matrix_element(g.dag(), e)
-        Re_chi1_off.append(np.real(rho_ge_off))
-        Im_chi1_off.append(np.imag(rho_ge_off))
-    return Re_chi1_on, Im_chi1_on, Re_chi1_off, Im_chi1_off
+    chi = np.empty((len(Omega_c), len(delta_p)), dtype=complex)
+    for i, omega_c in enumerate(Omega_c):
+        H_0 = H_p + omega_c * H_c
+        for j, dp in enumerate(delta_p):
+            # Steady state
+            rho_ss = steadystate(dp * H_dp + H_0, c_ops)
+            chi[i, j] = rho_ss.matrix_element(g.dag(), e)
+    return SusceptibilityCurves(Omega_c, delta_p, chi)
+
+
+def calculate_susceptibility(
+    delta_p: np.ndarray,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c_on: float,
+    Omega_c_off: float,
+    method: str = "batched"
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the real and imaginary part of the first-order susceptibility
+
+    Args:
+        delta_p (numpy.ndarray): Single-photon detunings
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c_on (float): Rabi frequency of the control laser (ON state)
+        Omega_c_off (float): Rabi frequency of the control laser (OFF state)
+        method (str, optional): one of SOLVERS, see calculate_susceptibilities.
+            Defaults to "batched"
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            Re_chi1_on: Real part of susceptibility (Control ON).
+            Im_chi1_on: Imaginary part of susceptibility (Control ON).
+            Re_chi1_off: Real part of susceptibility (Control OFF).
+            Im_chi1_off: Imaginary part of susceptibility (Control OFF).
+    """
+    chi_on, chi_off = calculate_susceptibilities(
+        delta_p, gamma, gamma_sg, Omega_p, [Omega_c_on, Omega_c_off], method=method).chi
+    return chi_on.real, chi_on.imag, chi_off.real, chi_off.imag
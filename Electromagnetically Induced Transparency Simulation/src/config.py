@@ -15,3 +15,18 @@ delta_p: Any = np.linspace(-3 * gamma, 3 * gamma, 1000)
 Omega_p: float = 0.1 * gamma
 Omega_c_on: float = 1.0 * gamma
 Omega_c_off: float = 0.0 * gamma
+# Adaptive detuning grid (python main.py --adaptive)
+delta_p_min: float = -3 * gamma
+delta_p_max: float = 3 * gamma
+adaptive_tol: float = 1e-4
+# Warm vapor (python main.py --doppler). Room-temperature Rb: Doppler width of
+# about 38 natural linewidths, co-propagating beams with k_c ~ k_p
+doppler_width: float = 38.0 * gamma
+n_velocity_classes: int = 1001
+k_ratio: float = 1.0
+geometry: str = "co"
+# On-disk cache of the susceptibility curves (python main.py --no-cache disables it)
+cache_dir: str = "cache"
+cache_max_bytes: int = 256 * 2 ** 20
+# Parquet dataset of the curves of every run (python main.py --no-results disables it)
+results_dir: str = "results/susceptibility"
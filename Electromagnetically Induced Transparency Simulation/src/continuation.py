@@ -0,0 +1,246 @@
+"""
+This module solves steady states along the detuning axis by continuation. The
+Liouvillian is affine in the probe detuning, L(dp) = L0 + dp * L1, so the work
+done for one reference detuning can be reused for every other point:
+
+- "eig": one eigen-decomposition of A_ref^-1 A1 turns every point into a
+  diagonal solve, for dense small and medium systems
+- "iterative": a sparse LU factorization of A_ref preconditions GMRES, which is
+  warm-started from the previous point's density matrix, for large sparse systems
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from typing import Optional, Tuple, Union
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, gmres, splu, spsolve
+from src.liouvillian import (
+    G, E, build_liouvillians, liouvillian_terms, solve_steady_states,
+    sparse_trace_constrained_system, trace_constrained_system, unvectorize
+)
+
+CONTINUATION_METHODS: Tuple[str, ...] = ("eig", "iterative")
+# Eigenvector bases worse conditioned than this fall back to direct solves
+MAX_EIGENVECTOR_CONDITION: float = 1e8
+
+Matrix = Union[np.ndarray, sp.spmatrix]
+
+
+def affine_system(L0: Matrix, L1: Matrix) -> Tuple[Matrix, Matrix, np.ndarray]:
+    """
+    Builds the trace-constrained affine system A(dp) = A0 + dp * A1, rhs b
+
+    Args:
+        L0 (Matrix): Liouvillian at zero detuning
+        L1 (Matrix): derivative of the Liouvillian with respect to the detuning
+
+    Returns:
+        Tuple[Matrix, Matrix, np.ndarray]: A0, A1 and the right-hand side b
+    """
+    b = np.zeros(L0.shape[0], dtype=complex)
+    b[0] = 1.0
+    if sp.issparse(L0):
+        A1 = sp.csr_matrix(L1, dtype=complex, copy=True)
+        A1.data[A1.indptr[0]:A1.indptr[1]] = 0.0
+        A1.eliminate_zeros()
+        return sparse_trace_constrained_system(L0), A1.tocsc(), b
+    A1 = np.array(L1, dtype=complex)
+    A1[0, :] = 0.0
+    return trace_constrained_system(np.asarray(L0)), A1, b
+
+
+def _continuation_eig(A_ref: np.ndarray, A1: np.ndarray, b: np.ndarray, shifts: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Solves (A_ref + s A1) x = b for all shifts s from one eigen-decomposition
+
+    Args:
+        A_ref (np.ndarray): system at the reference detuning
+        A1 (np.ndarray): detuning derivative of the system
+        b (np.ndarray): right-hand side
+        shifts (np.ndarray): detunings relative to the reference
+
+    Returns:
+        np.ndarray: solutions of shape (len(shifts), n^2), or None when the
+            eigenvector basis is too ill-conditioned
+    """
+    M = np.linalg.solve(A_ref, A1)
+    w, V = np.linalg.eig(M)
+    if np.linalg.cond(V) > MAX_EIGENVECTOR_CONDITION:
+        return None
+    c = np.linalg.solve(V, np.linalg.solve(A_ref, b))
+    return (c[None, :] / (1.0 + shifts[:, None] * w[None, :])) @ V.T
+
+
+def _continuation_iterative(
+    A_ref: Matrix,
+    A1: Matrix,
+    b: np.ndarray,
+    shifts: np.ndarray,
+    rtol: float
+) -> np.ndarray:
+    """
+    Solves (A_ref + s A1) x = b point by point with GMRES, preconditioned by the
+    LU factorization of A_ref and warm-started from the previous solution
+
+    Args:
+        A_ref (Matrix): system at the reference detuning
+        A1 (Matrix): detuning derivative of the system
+        b (np.ndarray): right-hand side
+        shifts (np.ndarray): detunings relative to the reference, in path order
+        rtol (float): relative tolerance of GMRES
+
+    Returns:
+        np.ndarray: solutions of shape (len(shifts), n^2)
+    """
+    A_ref = sp.csc_matrix(A_ref)
+    A1 = sp.csc_matrix(A1)
+    lu = splu(A_ref)
+    n2 = A_ref.shape[0]
+    preconditioner = LinearOperator((n2, n2), matvec=lu.solve, dtype=complex)
+    x = lu.solve(b)
+    solutions = np.empty((len(shifts), n2), dtype=complex)
+    for k, shift in enumerate(shifts):
+        A = A_ref + shift * A1
+        x, info = gmres(A, b, x0=x, M=preconditioner, rtol=rtol, atol=0.0)
+        if info != 0:
+            x = spsolve(A.tocsc(), b)
+        solutions[k] = x
+    return solutions
+
+
+def continuation_steady_states(
+    L0: Matrix,
+    L1: Matrix,
+    delta_p: np.ndarray,
+    method: str = "eig",
+    delta_ref: Optional[float] = None,
+    rtol: float = 1e-10
+) -> np.ndarray:
+    """
+    Solves the steady states of L0 + dp * L1 for every detuning dp in delta_p
+
+    Args:
+        L0 (Matrix): Liouvillian at zero detuning, dense or scipy.sparse
+        L1 (Matrix): derivative of the Liouvillian with respect to the detuning
+        delta_p (np.ndarray): detunings, ordered along the continuation path
+        method (str, optional): one of CONTINUATION_METHODS. Defaults to "eig"
+        delta_ref (float, optional): detuning where the system is factorized.
+            Defaults to the middle of delta_p
+        rtol (float, optional): relative tolerance of the iterative method.
+            Defaults to 1e-10
+
+    Returns:
+        np.ndarray: steady-state density matrices of shape (len(delta_p), n, n)
+    """
+    if method not in CONTINUATION_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {CONTINUATION_METHODS}")
+    delta_p = np.asarray(delta_p, dtype=float)
+    if delta_ref is None:
+        delta_ref = 0.5 * (delta_p.min() + delta_p.max())
+    A0, A1, b = affine_system(L0, L1)
+    A_ref = A0 + delta_ref * A1
+    shifts = delta_p - delta_ref
+
+    if method == "iterative":
+        return unvectorize(_continuation_iterative(A_ref, A1, b, shifts, rtol))
+
+    A_ref = A_ref.toarray() if sp.issparse(A_ref) else A_ref
+    A1 = A1.toarray() if sp.issparse(A1) else A1
+    solutions = _continuation_eig(A_ref, A1, b, shifts)
+    if solutions is None:
+        # Non-diagonalizable pencil: solve the stacked systems directly
+        L0 = L0.toarray() if sp.issparse(L0) else np.asarray(L0)
+        L1 = L1.toarray() if sp.issparse(L1) else np.asarray(L1)
+        return solve_steady_states(L0[None] + delta_p[:, None, None] * L1[None])
+    return unvectorize(solutions)
+
+
+def continuation_coherence(
+    delta_p: np.ndarray,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c: float,
+    delta_c: float = 0.0,
+    method: str = "eig"
+) -> np.ndarray:
+    """
+    Computes the steady-state probe coherence rho_ge of the Lambda system along
+    the detuning axis by continuation
+
+    Args:
+        delta_p (numpy.ndarray): Single-photon detunings
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (float): Rabi frequency of the control laser
+        delta_c (float, optional): Detuning of the control laser. Defaults to 0
+        method (str, optional): one of CONTINUATION_METHODS. Defaults to "eig"
+
+    Returns:
+        np.ndarray: complex rho_ge for every detuning
+    """
+    L0 = build_liouvillians(
+        delta_c=delta_c,
+        Omega_p=Omega_p,
+        Omega_c=Omega_c,
+        gamma=gamma,
+        gamma_sg=gamma_sg
+    )
+    L1 = liouvillian_terms()["delta_p"]
+    if method == "iterative":
+        L0, L1 = sp.csc_matrix(L0), sp.csc_matrix(L1)
+    return continuation_steady_states(L0, L1, delta_p, method)[:, G, E]
+
+
+def batched_continuation(
+    L0: np.ndarray,
+    L1: np.ndarray,
+    delta_p: np.ndarray,
+    component: int,
+    delta_ref: Optional[float] = None
+) -> np.ndarray:
+    """
+    Continuation for a stack of dense Liouvillians sharing the detuning derivative
+    L1: one batched eigen-decomposition per stacked system, then every detuning
+    costs a single weighted sum for the requested vector component
+
+    Args:
+        L0 (np.ndarray): stacked Liouvillians at zero detuning, shape (m, n^2, n^2)
+        L1 (np.ndarray): shared derivative with respect to the detuning
+        delta_p (np.ndarray): detunings
+        component (int): index of the column-stacked density matrix to return
+        delta_ref (float, optional): detuning where the systems are factorized.
+            Defaults to the middle of delta_p
+
+    Returns:
+        np.ndarray: component of the steady states, shape (m, len(delta_p))
+    """
+    delta_p = np.asarray(delta_p, dtype=float)
+    if delta_ref is None:
+        delta_ref = 0.5 * (delta_p.min() + delta_p.max())
+    A1 = np.array(L1, dtype=complex)
+    A1[0, :] = 0.0
+    A_ref = trace_constrained_system(L0) + delta_ref * A1
+    b = np.zeros(A_ref.shape[:-1], dtype=complex)
+    b[:, 0] = 1.0
+
+    w, V = np.linalg.eig(np.linalg.solve(A_ref, np.broadcast_to(A1, A_ref.shape)))
+    good = np.linalg.cond(V) < MAX_EIGENVECTOR_CONDITION
+    result = np.empty((len(L0), len(delta_p)), dtype=complex)
+
+    if good.any():
+        x_ref = np.linalg.solve(A_ref[good], b[good][..., None])
+        c = np.linalg.solve(V[good], x_ref)[..., 0]
+        weights = V[good][:, component, :] * c
+        shifts = delta_p - delta_ref
+        result[good] = np.einsum(
+            "mk,mdk->md", weights, 1.0 / (1.0 + shifts[None, :, None] * w[good][:, None, :]))
+    for m in np.flatnonzero(~good):
+        # Non-diagonalizable pencil: solve this system directly
+        L = L0[m][None] + delta_p[:, None, None] * L1[None]
+        n = int(round(np.sqrt(L1.shape[0])))
+        result[m] = solve_steady_states(L)[:, component % n, component // n]
+    return result
@@ -0,0 +1,213 @@
+"""
+This module computes the susceptibility of a warm vapor by averaging the steady
+states of all velocity classes of the Maxwell-Boltzmann distribution. An atom
+moving with velocity v along the beams sees the probe detuned by -k_p v and the
+control by -k_c v (co-propagating) or +k_c v (counter-propagating)
+
+All (detuning, velocity) pairs are solved as one batch, split in blocks that can
+be spread over a process pool. By default every velocity class is eigen-decomposed
+once and the detuning axis is covered by continuation (src/continuation.py), with
+blocks of velocity classes; "direct" solves every pair as a stacked linear system,
+with blocks of detunings
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil, pi
+from typing import Optional, Tuple
+import numpy as np
+from src.liouvillian import (
+    CHUNK_SIZE, G, E, N_LEVELS, build_liouvillians, liouvillian_terms, steady_state_coherence
+)
+from src.continuation import batched_continuation
+
+GEOMETRIES: Tuple[str, ...] = ("co", "counter")
+QUADRATURES: Tuple[str, ...] = ("uniform", "gauss-hermite")
+DOPPLER_METHODS: Tuple[str, ...] = ("continuation", "direct")
+# hermegauss overflows beyond about 350 nodes
+MAX_GAUSS_HERMITE_NODES: int = 300
+# Largest node spacing, in units of the narrowest feature of the line
+MAX_SPACING: float = 0.25
+
+
+def velocity_classes(
+    doppler_width: float,
+    n_classes: int = 1001,
+    quadrature: str = "uniform",
+    n_sigma: float = 4.0,
+    linewidth: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quadrature nodes and weights of the one-dimensional Maxwell-Boltzmann
+    distribution, expressed as probe Doppler shifts k_p v
+
+    The uniform rule keeps a constant spacing 2 n_sigma doppler_width / n_classes.
+    Gauss-Hermite nodes are densest at the centre, about pi doppler_width /
+    sqrt(n) apart, so it only suits distributions about one linewidth wide.
+    Both converge once the spacing is at most MAX_SPACING times the narrowest
+    feature of the line. Given linewidth, n_classes is raised until they do,
+    and Gauss-Hermite falls back to the uniform rule when it would need more
+    than MAX_GAUSS_HERMITE_NODES nodes
+
+    Args:
+        doppler_width (float): standard deviation of k_p v
+        n_classes (int, optional): number of velocity classes. Defaults to 1001
+        quadrature (str, optional): one of QUADRATURES. Defaults to "uniform"
+        n_sigma (float, optional): half-range of the uniform rule in standard
+            deviations. Defaults to 4
+        linewidth (float, optional): narrowest feature of the integrand in
+            Doppler shift. Defaults to None (n_classes as given)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Doppler shifts and weights summing to one
+    """
+    if quadrature not in QUADRATURES:
+        raise ValueError(f"Unknown quadrature '{quadrature}', expected one of {QUADRATURES}")
+    if doppler_width == 0.0:
+        return np.zeros(1), np.ones(1)
+    spacing = None if linewidth is None else MAX_SPACING * linewidth
+    if quadrature == "gauss-hermite":
+        n_nodes = n_classes
+        if spacing is not None:
+            n_nodes = max(n_classes, ceil((pi * doppler_width / spacing) ** 2))
+        if spacing is None or n_nodes <= MAX_GAUSS_HERMITE_NODES:
+            nodes, weights = np.polynomial.hermite_e.hermegauss(n_nodes)
+            return doppler_width * nodes, weights / weights.sum()
+    if spacing is not None:
+        n_classes = max(n_classes, ceil(2 * n_sigma * doppler_width / spacing) + 1)
+    nodes = np.linspace(-n_sigma, n_sigma, n_classes)
+    weights = np.exp(-0.5 * nodes ** 2)
+    return doppler_width * nodes, weights / weights.sum()
+
+
+def _average_block(
+    delta_p: np.ndarray,
+    shifts: np.ndarray,
+    weights: np.ndarray,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c: float,
+    delta_c: float,
+    control_shift: float,
+    method: str
+) -> np.ndarray:
+    """
+    Solves all (detuning, velocity) pairs of a block and averages over velocity
+
+    Args:
+        delta_p (np.ndarray): block of probe detunings
+        shifts (np.ndarray): probe Doppler shifts of the velocity classes
+        weights (np.ndarray): weights of the velocity classes
+        gamma, gamma_sg, Omega_p, Omega_c, delta_c: see doppler_susceptibility
+        control_shift (float): control Doppler shift per unit of probe shift
+        method (str): one of DOPPLER_METHODS
+
+    Returns:
+        np.ndarray: velocity-averaged rho_ge of the block
+    """
+    if method == "continuation":
+        # L(dp, v) = L0(v) + dp * L1 with the shifted detunings folded into L0(v)
+        L0 = build_liouvillians(
+            delta_p=-shifts,
+            delta_c=delta_c - control_shift * shifts,
+            Omega_p=Omega_p,
+            Omega_c=Omega_c,
+            gamma=gamma,
+            gamma_sg=gamma_sg
+        )
+        rho_ge = batched_continuation(
+            L0, liouvillian_terms()["delta_p"], delta_p, component=E * N_LEVELS + G)
+        return weights @ rho_ge
+    rho_ge = steady_state_coherence(
+        delta_p[:, None] - shifts[None, :],
+        gamma,
+        gamma_sg,
+        Omega_p,
+        Omega_c,
+        delta_c=delta_c - control_shift * shifts[None, :]
+    )
+    return rho_ge @ weights
+
+
+def doppler_susceptibility(
+    delta_p: np.ndarray,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c: float,
+    doppler_width: float,
+    delta_c: float = 0.0,
+    k_ratio: float = 1.0,
+    geometry: str = "co",
+    n_classes: int = 1001,
+    quadrature: str = "uniform",
+    method: str = "continuation",
+    n_workers: Optional[int] = 1
+) -> np.ndarray:
+    """
+    Computes the Doppler-broadened steady-state coherence rho_ge of a warm vapor
+
+    Args:
+        delta_p (numpy.ndarray): Single-photon detunings
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (float): Rabi frequency of the control laser
+        doppler_width (float): standard deviation of the probe Doppler shift k_p v
+        delta_c (float, optional): Detuning of the control laser. Defaults to 0
+        k_ratio (float, optional): ratio k_c / k_p of the wave numbers. Defaults to 1
+        geometry (str, optional): "co" or "counter" propagating beams. Defaults to "co"
+        n_classes (int, optional): minimum number of velocity classes; it is
+            raised to resolve the line, see velocity_classes. Defaults to 1001
+        quadrature (str, optional): one of QUADRATURES; Gauss-Hermite falls back
+            to the uniform rule for wide distributions. Defaults to "uniform"
+        method (str, optional): one of DOPPLER_METHODS. Defaults to "continuation"
+        n_workers (int, optional): worker processes; None uses os.cpu_count().
+            Defaults to 1 (current process)
+
+    Returns:
+        np.ndarray: complex velocity-averaged rho_ge for every detuning
+    """
+    if geometry not in GEOMETRIES:
+        raise ValueError(f"Unknown geometry '{geometry}', expected one of {GEOMETRIES}")
+    if method not in DOPPLER_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {DOPPLER_METHODS}")
+    delta_p = np.asarray(delta_p, dtype=float)
+    control_shift = k_ratio if geometry == "co" else -k_ratio
+    # The one-photon line is about gamma wide; the transparency window, about
+    # Omega_c^2 / gamma wide, moves with the two-photon shift (1 - control_shift) k_p v
+    linewidth = gamma
+    if control_shift != 1.0 and Omega_c != 0.0:
+        linewidth = min(linewidth, (Omega_c ** 2 / gamma + gamma_sg) / abs(1.0 - control_shift))
+    shifts, weights = velocity_classes(doppler_width, n_classes, quadrature, linewidth=linewidth)
+
+    if method == "continuation":
+        block = max(1, CHUNK_SIZE // len(delta_p))
+        blocks = [
+            (slice(None), slice(start, start + block))
+            for start in range(0, len(shifts), block)
+        ]
+    else:
+        block = max(1, CHUNK_SIZE // len(shifts))
+        blocks = [
+            (slice(start, start + block), slice(None))
+            for start in range(0, len(delta_p), block)
+        ]
+    tasks = [
+        (delta_p[dp], shifts[v], weights[v], gamma, gamma_sg, Omega_p, Omega_c,
+         delta_c, control_shift, method)
+        for dp, v in blocks
+    ]
+    if n_workers == 1:
+        results = [_average_block(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_average_block, *zip(*tasks)))
+
+    rho_ge = np.zeros(len(delta_p), dtype=complex)
+    for (dp, _), partial in zip(blocks, results):
+        rho_ge[dp] += partial
+    return rho_ge
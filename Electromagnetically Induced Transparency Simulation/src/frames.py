@@ -0,0 +1,187 @@
+"""
+This module writes animation frames of the EIT solver to memory-mapped files,
+to be streamed by the data-driven scene of the Manim project. Every frame holds
+a probe coherence curve and the populations of the three levels:
+
+- control sweep: one steady-state susceptibility curve per control Rabi
+  frequency, with the populations at two-photon resonance
+- pulse: the probe coherence rho_ge over a sliding time window of a trajectory
+  of src/pulses.py, with the populations at the end of the window
+
+Frame stores are directories with the files:
+    meta.json: kind, name of the frame parameter and axis limits of the whole run
+    x.npy: abscissas of the curves, shape (n_points,)
+    chi.npy: complex curves, shape (n_frames, n_points)
+    populations.npy: populations of g, e and s, shape (n_frames, 3)
+    parameter.npy: value of the frame parameter, shape (n_frames,)
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import json
+import os
+from typing import Dict, Sequence, Tuple
+import numpy as np
+from src.calculations import calculate_susceptibilities
+from src.liouvillian import G, E, N_LEVELS, build_liouvillians, solve_steady_states
+
+# Frames computed and written per chunk
+FRAMES_PER_CHUNK: int = 256
+
+
+def _open_frames(store: str, x: np.ndarray, n_frames: int) -> Dict[str, np.ndarray]:
+    """
+    Creates the memory-mapped files of a frame store
+
+    Args:
+        store (str): directory of the frame files
+        x (np.ndarray): abscissas of the curves
+        n_frames (int): number of frames
+
+    Returns:
+        Dict[str, np.ndarray]: writable memory maps of chi, populations and parameter
+    """
+    os.makedirs(store, exist_ok=True)
+    np.save(os.path.join(store, "x.npy"), np.asarray(x, dtype=float))
+    shapes = {
+        "chi": ((n_frames, len(x)), complex),
+        "populations": ((n_frames, N_LEVELS), float),
+        "parameter": ((n_frames,), float)
+    }
+    return {
+        name: np.lib.format.open_memmap(
+            os.path.join(store, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape)
+        for name, (shape, dtype) in shapes.items()
+    }
+
+
+def _close_frames(store: str, frames: Dict[str, np.ndarray], kind: str, parameter: str) -> None:
+    """
+    Flushes the memory maps of a frame store and writes its metadata, including
+    the axis limits over all frames, so every segment of an animation shares them
+
+    Args:
+        store (str): directory of the frame files
+        frames (Dict[str, np.ndarray]): memory maps returned by _open_frames
+        kind (str): "control-sweep" or "pulse"
+        parameter (str): name of the frame parameter
+    """
+    chi = frames["chi"]
+    low, high = np.inf, -np.inf
+    for start in range(0, len(chi), FRAMES_PER_CHUNK):
+        part = chi[start:start + FRAMES_PER_CHUNK]
+        low = min(low, float(part.real.min()), float(part.imag.min()))
+        high = max(high, float(part.real.max()), float(part.imag.max()))
+    for array in frames.values():
+        array.flush()
+    x = np.load(os.path.join(store, "x.npy"))
+    meta = {
+        "kind": kind,
+        "parameter": parameter,
+        "n_frames": len(chi),
+        "x_range": [float(x[0]), float(x[-1])],
+        "chi_range": [low, high]
+    }
+    with open(os.path.join(store, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+
+def control_sweep_frames(
+    store: str,
+    delta_p: np.ndarray,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c: Sequence[float]
+) -> str:
+    """
+    Writes one frame per control Rabi frequency, e.g. a slow ramp of the control
+    power that opens the transparency window
+
+    Args:
+        store (str): directory of the frame files
+        delta_p (numpy.ndarray): Single-photon detunings
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (Sequence[float]): Rabi frequencies of the control laser, one per frame
+
+    Returns:
+        str: the frame store
+    """
+    Omega_c = np.atleast_1d(np.asarray(Omega_c, dtype=float))
+    frames = _open_frames(store, delta_p, len(Omega_c))
+    for start in range(0, len(Omega_c), FRAMES_PER_CHUNK):
+        part = Omega_c[start:start + FRAMES_PER_CHUNK]
+        frames["chi"][start:start + len(part)] = calculate_susceptibilities(
+            delta_p, gamma, gamma_sg, Omega_p, part).chi
+        rho = solve_steady_states(build_liouvillians(
+            Omega_p=Omega_p, Omega_c=part, gamma=gamma, gamma_sg=gamma_sg))
+        frames["populations"][start:start + len(part)] = np.diagonal(rho, axis1=-2, axis2=-1).real
+        frames["parameter"][start:start + len(part)] = part
+    _close_frames(store, frames, "control-sweep", "Omega_c")
+    return store
+
+
+def pulse_frames(
+    store: str,
+    times: np.ndarray,
+    rho_t: np.ndarray,
+    frame_every: int = 1,
+    window: int = 500
+) -> str:
+    """
+    Writes the frames of a trajectory of src/pulses.py, e.g. a storage and
+    retrieval experiment: every frame shows the probe coherence over the last
+    window samples, like an oscilloscope trace, and the current populations
+
+    Args:
+        store (str): directory of the frame files
+        times (np.ndarray): times of the trajectory
+        rho_t (np.ndarray): density matrices of the trajectory, may be a memory map
+        frame_every (int, optional): trajectory samples per frame. Defaults to 1
+        window (int, optional): samples shown per frame. Defaults to 500
+
+    Returns:
+        str: the frame store
+    """
+    samples = np.arange(0, len(times), frame_every)
+    dt = float(times[1] - times[0]) if len(times) > 1 else 0.0
+    # Window offsets in samples, the curve ends at the current sample
+    offsets = np.arange(window) - (window - 1)
+    frames = _open_frames(store, offsets * dt, len(samples))
+    for start in range(0, len(samples), FRAMES_PER_CHUNK):
+        part = samples[start:start + FRAMES_PER_CHUNK]
+        first = max(0, int(part[0]) - window + 1)
+        # Contiguous block of the trajectory covering the windows of the chunk
+        block = np.asarray(rho_t[first:int(part[-1]) + 1])
+        # Samples before the start of the trajectory repeat the initial state
+        index = np.clip(part[:, None] + offsets[None, :], 0, None) - first
+        frames["chi"][start:start + len(part)] = block[index, G, E]
+        last = block[part - first]
+        frames["populations"][start:start + len(part)] = np.diagonal(last, axis1=-2, axis2=-1).real
+        frames["parameter"][start:start + len(part)] = times[part]
+    _close_frames(store, frames, "pulse", "t")
+    return store
+
+
+def load_frames(store: str) -> Tuple[Dict[str, object], Dict[str, np.ndarray]]:
+    """
+    Opens a frame store read-only
+
+    Args:
+        store (str): directory of the frame files
+
+    Returns:
+        Tuple[Dict[str, object], Dict[str, np.ndarray]]:
+            metadata of the store
+            memory maps of x, chi, populations and parameter
+    """
+    with open(os.path.join(store, "meta.json")) as f:
+        meta = json.load(f)
+    arrays = {
+        name: np.load(os.path.join(store, f"{name}.npy"), mmap_mode="r")
+        for name in ("x", "chi", "populations", "parameter")
+    }
+    return meta, arrays
@@ -0,0 +1,308 @@
+"""
+This module generates sparse Lindblad models from a generic description of an
+atomic level scheme, so that multi-level systems beyond the three-level Lambda
+scheme (ladder and V schemes, hyperfine manifolds, DLCZ level structures) are
+built and solved without hand-written operators
+
+A level scheme is a dictionary with the keys:
+    "levels": list of level names
+    "detunings": {level: energy in the rotating frame}, missing levels at zero
+    "couplings": list of (level_a, level_b, Omega), adding Omega (|a><b| + |b><a|)
+    "decays": list of (upper, lower, rate), collapse operator sqrt(rate) |lower><upper|
+    "dephasings": list of (level, rate), collapse operator sqrt(rate) |level><level|
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from typing import Any, Dict, List, Tuple
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, gmres, spilu, spsolve
+from src.liouvillian import sparse_trace_constrained_system, unvectorize
+
+SPARSE_METHODS: Tuple[str, ...] = ("direct", "iterative")
+
+LevelScheme = Dict[str, Any]
+
+
+def _index(scheme: LevelScheme, level: Any) -> int:
+    """
+    Returns the index of a level given by name or by index
+
+    Args:
+        scheme (LevelScheme): level scheme
+        level (Any): level name or index
+
+    Returns:
+        int: index of the level
+    """
+    if isinstance(level, (int, np.integer)):
+        return int(level)
+    return scheme["levels"].index(level)
+
+
+def _ket_bra(n: int, i: int, j: int) -> sp.csr_matrix:
+    """
+    Sparse operator |i><j| on n levels
+
+    Args:
+        n (int): number of levels
+        i (int): index of the ket
+        j (int): index of the bra
+
+    Returns:
+        scipy.sparse.csr_matrix: n x n operator
+    """
+    return sp.csr_matrix(([1.0 + 0j], ([i], [j])), shape=(n, n))
+
+
+def build_hamiltonian(scheme: LevelScheme) -> sp.csr_matrix:
+    """
+    Builds the rotating-frame Hamiltonian of a level scheme
+
+    Args:
+        scheme (LevelScheme): level scheme
+
+    Returns:
+        scipy.sparse.csr_matrix: n x n Hamiltonian
+    """
+    n = len(scheme["levels"])
+    rows, cols, values = [], [], []
+    for level, energy in scheme.get("detunings", {}).items():
+        i = _index(scheme, level)
+        rows.append(i)
+        cols.append(i)
+        values.append(energy)
+    for a, b, omega in scheme.get("couplings", []):
+        i, j = _index(scheme, a), _index(scheme, b)
+        rows += [i, j]
+        cols += [j, i]
+        values += [omega, omega]
+    return sp.csr_matrix(
+        (np.asarray(values, dtype=complex), (rows, cols)), shape=(n, n))
+
+
+def build_collapse_operators(scheme: LevelScheme) -> List[sp.csr_matrix]:
+    """
+    Builds the collapse operators of the decays and dephasings of a level scheme
+
+    Args:
+        scheme (LevelScheme): level scheme
+
+    Returns:
+        List[scipy.sparse.csr_matrix]: collapse operators including their rates
+    """
+    n = len(scheme["levels"])
+    c_ops = [
+        np.sqrt(rate) * _ket_bra(n, _index(scheme, lower), _index(scheme, upper))
+        for upper, lower, rate in scheme.get("decays", [])
+    ]
+    c_ops += [
+        np.sqrt(rate) * _ket_bra(n, _index(scheme, level), _index(scheme, level))
+        for level, rate in scheme.get("dephasings", [])
+    ]
+    return c_ops
+
+
+def build_liouvillian(scheme: LevelScheme) -> sp.csr_matrix:
+    """
+    Builds the sparse Liouvillian of a level scheme with column-stacked density
+    matrices, as in src/liouvillian.py. The Liouvillian is linear in the
+    detunings, so the Liouvillian of a scheme holding only a detuning pattern is
+    the L1 of src/continuation.py
+
+    Args:
+        scheme (LevelScheme): level scheme
+
+    Returns:
+        scipy.sparse.csr_matrix: n^2 x n^2 Liouvillian
+    """
+    n = len(scheme["levels"])
+    identity = sp.identity(n, dtype=complex, format="csr")
+    H = build_hamiltonian(scheme)
+    L = -1j * (sp.kron(identity, H) - sp.kron(H.T, identity))
+    for c in build_collapse_operators(scheme):
+        cdc = (c.conj().T @ c).tocsr()
+        L = L + sp.kron(c.conj(), c) - 0.5 * (sp.kron(identity, cdc) + sp.kron(cdc.T, identity))
+    return sp.csr_matrix(L)
+
+
+def sparse_steady_state(
+    L: sp.spmatrix,
+    method: str = "direct",
+    rtol: float = 1e-10
+) -> np.ndarray:
+    """
+    Solves the trace-normalized steady state of a sparse Liouvillian
+
+    Args:
+        L (scipy.sparse.spmatrix): Liouvillian of shape (n^2, n^2)
+        method (str, optional): "direct" sparse LU or "iterative" GMRES with an
+            incomplete LU preconditioner, which falls back to the direct solve
+            when the preconditioner breaks down. Defaults to "direct"
+        rtol (float, optional): relative tolerance of GMRES. Defaults to 1e-10
+
+    Returns:
+        np.ndarray: dense n x n steady-state density matrix
+    """
+    if method not in SPARSE_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {SPARSE_METHODS}")
+    A = sparse_trace_constrained_system(L)
+    b = np.zeros(A.shape[0], dtype=complex)
+    b[0] = 1.0
+    if method == "iterative":
+        try:
+            ilu = spilu(A, drop_tol=1e-6, fill_factor=30, diag_pivot_thresh=1.0)
+        except RuntimeError:
+            # Incomplete factorization broke down: fall back to the direct solve
+            return unvectorize(spsolve(A, b))
+        preconditioner = LinearOperator(A.shape, matvec=ilu.solve, dtype=complex)
+        x, info = gmres(A, b, M=preconditioner, rtol=rtol, atol=0.0, restart=50, maxiter=20)
+        if info == 0:
+            return unvectorize(x)
+    return unvectorize(spsolve(A, b))
+
+
+def lambda_scheme(
+    delta_p: float,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c: float,
+    delta_c: float = 0.0
+) -> LevelScheme:
+    """
+    The three-level Lambda scheme of calculate_susceptibility
+
+    Args:
+        delta_p (float): Single-photon detuning
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (float): Rabi frequency of the control laser
+        delta_c (float, optional): Detuning of the control laser. Defaults to 0
+
+    Returns:
+        LevelScheme: level scheme with levels g, e, s
+    """
+    return {
+        "levels": ["g", "e", "s"],
+        "detunings": {"e": -delta_p, "s": delta_p - delta_c},
+        "couplings": [("e", "g", Omega_p), ("e", "s", Omega_c)],
+        "decays": [("e", "g", gamma), ("s", "g", gamma_sg)]
+    }
+
+
+def ladder_scheme(
+    delta_p: float,
+    delta_c: float,
+    gamma: float,
+    gamma_r: float,
+    Omega_p: float,
+    Omega_c: float
+) -> LevelScheme:
+    """
+    Three-level ladder scheme g -> e -> r, probe on g-e and control on e-r
+
+    Args:
+        delta_p (float): Probe detuning
+        delta_c (float): Control detuning
+        gamma (float): Decay rate of e to g
+        gamma_r (float): Decay rate of r to e
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (float): Rabi frequency of the control laser
+
+    Returns:
+        LevelScheme: level scheme with levels g, e, r
+    """
+    return {
+        "levels": ["g", "e", "r"],
+        "detunings": {"e": -delta_p, "r": -(delta_p + delta_c)},
+        "couplings": [("e", "g", Omega_p), ("r", "e", Omega_c)],
+        "decays": [("e", "g", gamma), ("r", "e", gamma_r)]
+    }
+
+
+def v_scheme(
+    delta_p: float,
+    delta_c: float,
+    gamma_p: float,
+    gamma_c: float,
+    Omega_p: float,
+    Omega_c: float
+) -> LevelScheme:
+    """
+    Three-level V scheme, probe on g-e1 and control on g-e2
+
+    Args:
+        delta_p (float): Probe detuning
+        delta_c (float): Control detuning
+        gamma_p (float): Decay rate of e1 to g
+        gamma_c (float): Decay rate of e2 to g
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (float): Rabi frequency of the control laser
+
+    Returns:
+        LevelScheme: level scheme with levels g, e1, e2
+    """
+    return {
+        "levels": ["g", "e1", "e2"],
+        "detunings": {"e1": -delta_p, "e2": -delta_c},
+        "couplings": [("e1", "g", Omega_p), ("e2", "g", Omega_c)],
+        "decays": [("e1", "g", gamma_p), ("e2", "g", gamma_c)]
+    }
+
+
+def hyperfine_scheme(
+    n_ground: int,
+    n_excited: int,
+    delta_p: float,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c: float,
+    zeeman: float = 0.0
+) -> LevelScheme:
+    """
+    Lambda scheme between two ground hyperfine manifolds g_m, s_m and one excited
+    manifold e_m. The probe drives g_m - e_m and the control drives s_m - e_m
+    with sigma+, pi and sigma- components (|m - m'| <= 1). Excited sublevels
+    decay evenly to the reachable ground sublevels, and s_m relaxes to g_m
+
+    Args:
+        n_ground (int): Zeeman sublevels of each ground manifold
+        n_excited (int): Zeeman sublevels of the excited manifold
+        delta_p (float): Single-photon detuning
+        gamma (float): Decay rate of the excited manifold
+        gamma_sg (float): Relaxation rate between the ground manifolds
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (float): Rabi frequency of the control laser
+        zeeman (float, optional): Zeeman splitting per sublevel. Defaults to 0
+
+    Returns:
+        LevelScheme: level scheme with 2 n_ground + n_excited levels
+    """
+    ground = [f"g{m}" for m in range(n_ground)]
+    storage = [f"s{m}" for m in range(n_ground)]
+    excited = [f"e{m}" for m in range(n_excited)]
+    offset = (n_excited - n_ground) // 2
+    couplings, decays = [], []
+    for k in range(n_excited):
+        lower = [m for m in range(n_ground) if abs(m + offset - k) <= 1]
+        for m in lower:
+            couplings.append((excited[k], ground[m], Omega_p))
+            couplings.append((excited[k], storage[m], Omega_c))
+        branches = 2 * len(lower)
+        decays += [(excited[k], ground[m], gamma / branches) for m in lower]
+        decays += [(excited[k], storage[m], gamma / branches) for m in lower]
+    decays += [(storage[m], ground[m], gamma_sg) for m in range(n_ground)]
+    detunings = {level: zeeman * m for m, level in enumerate(ground)}
+    detunings.update({level: delta_p + zeeman * m for m, level in enumerate(storage)})
+    detunings.update({level: -delta_p + zeeman * (k - offset) for k, level in enumerate(excited)})
+    return {
+        "levels": ground + storage + excited,
+        "detunings": detunings,
+        "couplings": couplings,
+        "decays": decays
+    }
@@ -0,0 +1,239 @@
+"""
+This module assembles the Liouvillian superoperator of the three-level Lambda
+system with NumPy and solves its steady states for whole parameter grids at once
+as stacked linear systems
+
+Density matrices are vectorized by stacking their columns, so that
+vec(A X B) = (B^T kron A) vec(X)
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from functools import lru_cache
+from typing import Dict
+import numpy as np
+import scipy.sparse as sp
+
+# Levels of the Lambda system
+N_LEVELS: int = 3
+G, E, S = 0, 1, 2
+
+# Default number of grid points solved per stacked call
+CHUNK_SIZE: int = 100_000
+
+
+def ket_bra(i: int, j: int, n: int = N_LEVELS) -> np.ndarray:
+    """
+    Returns the operator |i><j|
+
+    Args:
+        i (int): index of the ket
+        j (int): index of the bra
+        n (int, optional): number of levels. Defaults to N_LEVELS
+
+    Returns:
+        np.ndarray: n x n complex matrix
+    """
+    op = np.zeros((n, n), dtype=complex)
+    op[i, j] = 1.0
+    return op
+
+
+def hamiltonian_superoperator(H: np.ndarray) -> np.ndarray:
+    """
+    Superoperator of the coherent part -i[H, rho]
+
+    Args:
+        H (np.ndarray): Hamiltonian
+
+    Returns:
+        np.ndarray: n^2 x n^2 superoperator
+    """
+    identity = np.eye(H.shape[0])
+    return -1j * (np.kron(identity, H) - np.kron(H.T, identity))
+
+
+def dissipator(c: np.ndarray) -> np.ndarray:
+    """
+    Superoperator of the Lindblad dissipator D[c] for a unit-rate collapse operator
+
+    Args:
+        c (np.ndarray): collapse operator
+
+    Returns:
+        np.ndarray: n^2 x n^2 superoperator
+    """
+    identity = np.eye(c.shape[0])
+    cdc = c.conj().T @ c
+    return np.kron(c.conj(), c) - 0.5 * (np.kron(identity, cdc) + np.kron(cdc.T, identity))
+
+
+@lru_cache(maxsize=None)
+def liouvillian_terms() -> Dict[str, np.ndarray]:
+    """
+    Splits the Liouvillian into superoperators that are linear in each parameter,
+    L = sum_k p_k L_k, using the Hamiltonian of calculate_susceptibility
+    H = -delta_p |e><e| + (delta_p - delta_c) |s><s|
+        + Omega_p (|e><g| + |g><e|) + Omega_c (|e><s| + |s><e|)
+    and the collapse operators sqrt(gamma) |g><e| and sqrt(gamma_sg) |g><s|
+
+    Returns:
+        Dict[str, np.ndarray]: superoperator multiplying each parameter
+    """
+    proj_e = ket_bra(E, E)
+    proj_s = ket_bra(S, S)
+    terms = {
+        "delta_p": hamiltonian_superoperator(proj_s - proj_e),
+        "delta_c": hamiltonian_superoperator(-proj_s),
+        "Omega_p": hamiltonian_superoperator(ket_bra(E, G) + ket_bra(G, E)),
+        "Omega_c": hamiltonian_superoperator(ket_bra(E, S) + ket_bra(S, E)),
+        "gamma": dissipator(ket_bra(G, E)),
+        "gamma_sg": dissipator(ket_bra(G, S))
+    }
+    for term in terms.values():
+        term.setflags(write=False)
+    return terms
+
+
+def build_liouvillians(**params: np.ndarray) -> np.ndarray:
+    """
+    Builds the stacked Liouvillians for broadcastable parameter arrays
+
+    Args:
+        **params (np.ndarray): values of the parameters in liouvillian_terms;
+            missing parameters are zero
+
+    Returns:
+        np.ndarray: array of shape broadcast_shape + (9, 9)
+    """
+    terms = liouvillian_terms()
+    unknown = set(params) - set(terms)
+    if unknown:
+        raise ValueError(f"Unknown Liouvillian parameters: {sorted(unknown)}")
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in params.values()])
+    L = np.zeros(arrays[0].shape + (N_LEVELS ** 2, N_LEVELS ** 2), dtype=complex)
+    for name, values in zip(params, arrays):
+        L += values[..., None, None] * terms[name]
+    return L
+
+
+def trace_constrained_system(L: np.ndarray) -> np.ndarray:
+    """
+    Replaces the first equation of L rho = 0 by the normalization Tr(rho) = 1
+
+    Args:
+        L (np.ndarray): stacked Liouvillians of shape (..., n^2, n^2)
+
+    Returns:
+        np.ndarray: stacked matrices A such that A rho = e_0
+    """
+    n = int(round(np.sqrt(L.shape[-1])))
+    A = L.copy()
+    A[..., 0, :] = 0.0
+    A[..., 0, np.arange(n) * (n + 1)] = 1.0
+    return A
+
+
+def sparse_trace_constrained_system(L: sp.spmatrix) -> sp.csc_matrix:
+    """
+    Sparse version of trace_constrained_system for a single Liouvillian
+
+    Args:
+        L (scipy.sparse.spmatrix): Liouvillian of shape (n^2, n^2)
+
+    Returns:
+        scipy.sparse.csc_matrix: matrix A such that A rho = e_0
+    """
+    n2 = L.shape[0]
+    n = int(round(np.sqrt(n2)))
+    L = sp.csr_matrix(L, dtype=complex, copy=True)
+    # Zero the first row in place, then add the trace row
+    L.data[L.indptr[0]:L.indptr[1]] = 0.0
+    trace_row = sp.csr_matrix(
+        (np.ones(n), (np.zeros(n, dtype=int), np.arange(n) * (n + 1))), shape=(n2, n2))
+    A = L + trace_row
+    A.eliminate_zeros()
+    return A.tocsc()
+
+
+def solve_steady_states(L: np.ndarray, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+    """
+    Solves the steady states of stacked Liouvillians with batched linear algebra
+
+    Args:
+        L (np.ndarray): stacked Liouvillians of shape (..., n^2, n^2)
+        chunk_size (int, optional): systems solved per call. Defaults to CHUNK_SIZE
+
+    Returns:
+        np.ndarray: steady-state density matrices of shape (..., n, n)
+    """
+    n2 = L.shape[-1]
+    flat = L.reshape(-1, n2, n2)
+    rho = np.empty((flat.shape[0], n2), dtype=complex)
+    b = np.zeros(n2, dtype=complex)
+    b[0] = 1.0
+    for start in range(0, flat.shape[0], chunk_size):
+        A = trace_constrained_system(flat[start:start + chunk_size])
+        rhs = np.broadcast_to(b, A.shape[:-1])[..., None]
+        rho[start:start + chunk_size] = np.linalg.solve(A, rhs)[..., 0]
+    return unvectorize(rho.reshape(L.shape[:-1]))
+
+
+def unvectorize(rho_vec: np.ndarray) -> np.ndarray:
+    """
+    Turns column-stacked density matrices back into matrices
+
+    Args:
+        rho_vec (np.ndarray): vectors of shape (..., n^2)
+
+    Returns:
+        np.ndarray: density matrices of shape (..., n, n)
+    """
+    n = int(round(np.sqrt(rho_vec.shape[-1])))
+    # Column stacking: vec index = column * n + row
+    return rho_vec.reshape(rho_vec.shape[:-1] + (n, n)).swapaxes(-1, -2)
+
+
+def steady_state_coherence(
+    delta_p: np.ndarray,
+    gamma: float,
+    gamma_sg: float,
+    Omega_p: float,
+    Omega_c: float,
+    delta_c: float = 0.0,
+    chunk_size: int = CHUNK_SIZE
+) -> np.ndarray:
+    """
+    Computes the steady-state probe coherence rho_ge = <g|rho|e> for broadcastable
+    parameters, building and solving the Liouvillians chunk by chunk
+
+    Args:
+        delta_p (numpy.ndarray): Single-photon detunings
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        Omega_p (float): Rabi frequency of the probe field
+        Omega_c (float): Rabi frequency of the control laser
+        delta_c (float, optional): Detuning of the control laser. Defaults to 0
+        chunk_size (int, optional): systems solved per call. Defaults to CHUNK_SIZE
+
+    Returns:
+        np.ndarray: complex rho_ge with the broadcast shape of the parameters
+    """
+    arrays = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (delta_p, delta_c, Omega_p, Omega_c, gamma, gamma_sg)])
+    shape = arrays[0].shape
+    flat = [a.ravel() for a in arrays]
+    rho_ge = np.empty(flat[0].size, dtype=complex)
+    for start in range(0, rho_ge.size, chunk_size):
+        part = [a[start:start + chunk_size] for a in flat]
+        L = build_liouvillians(
+            delta_p=part[0],
+            delta_c=part[1],
+            Omega_p=part[2],
+            Omega_c=part[3],
+            gamma=part[4],
+            gamma_sg=part[5]
+        )
+        rho_ge[start:start + chunk_size] = solve_steady_states(L, chunk_size)[:, G, E]
+    return rho_ge.reshape(shape)
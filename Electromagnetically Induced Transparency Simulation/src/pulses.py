@@ -0,0 +1,245 @@
+"""
+This module integrates the time-dependent Lindblad equation of the Lambda system
+for piecewise-constant probe and control envelopes, as needed to write, store and
+retrieve a probe pulse in an EIT quantum memory
+
+Every constant segment is propagated with the exact propagator exp(L dt), which
+is computed once per distinct set of parameters and reused by every repeated
+segment. Trajectories are streamed to a memory-mapped file in chunks, so long
+storage times never have to fit in memory
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import os
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from scipy.linalg import expm
+from src import config
+from src.liouvillian import G, S, N_LEVELS, build_liouvillians, unvectorize
+
+Segment = Dict[str, float]
+
+# Number of saved samples buffered in memory before they are written to disk
+CHUNK_SAMPLES: int = 10_000
+
+
+class PropagatorCache:
+    """
+    Cache of the propagators exp(L dt) and their powers, keyed by the segment
+    parameters, the time step and the number of steps
+    """
+
+    def __init__(self, base: Optional[Segment] = None) -> None:
+        self.base = {
+            "delta_p": 0.0,
+            "Omega_p": config.Omega_p,
+            "Omega_c": config.Omega_c_on,
+            "gamma": config.gamma,
+            "gamma_sg": config.gamma_sg
+        }
+        self.base.update(base or {})
+        self._cache: Dict[Tuple, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, segment: Segment, dt: float, steps: int = 1) -> np.ndarray:
+        """
+        Returns exp(L dt)^steps for the parameters of a segment
+
+        Args:
+            segment (Segment): parameters overriding the base values
+            dt (float): time step
+            steps (int, optional): number of steps. Defaults to 1
+
+        Returns:
+            np.ndarray: n^2 x n^2 propagator
+        """
+        params = dict(self.base)
+        params.update({k: v for k, v in segment.items() if k != "duration"})
+        key = (tuple(sorted(params.items())), dt, steps)
+        if key not in self._cache:
+            if steps == 1:
+                self._cache[key] = expm(build_liouvillians(**params) * dt)
+            else:
+                self._cache[key] = np.linalg.matrix_power(self.get(segment, dt), steps)
+        return self._cache[key]
+
+
+def simulate_pulse_sequence(
+    segments: List[Segment],
+    dt: float,
+    store: str,
+    save_every: int = 1,
+    rho0: Optional[np.ndarray] = None,
+    cache: Optional[PropagatorCache] = None,
+    chunk_samples: int = CHUNK_SAMPLES
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Propagates the density matrix through a sequence of constant segments and
+    streams the trajectory, sampled every save_every steps, to disk
+
+    Args:
+        segments (List[Segment]): segments with a "duration" and any parameter of
+            src/liouvillian.liouvillian_terms (e.g. "Omega_p", "Omega_c")
+        dt (float): time step; durations are rounded to whole steps
+        store (str): directory of the trajectory files
+        save_every (int, optional): steps between saved samples. Defaults to 1
+        rho0 (np.ndarray, optional): initial density matrix. Defaults to |g><g|
+        cache (PropagatorCache, optional): propagators shared between runs.
+            Defaults to a new cache with the values of src/config.py
+        chunk_samples (int, optional): samples buffered before each write.
+            Defaults to CHUNK_SAMPLES
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            times of the saved samples
+            read-only memory map of the density matrices, shape (n_samples, n, n)
+    """
+    if cache is None:
+        cache = PropagatorCache()
+    if rho0 is None:
+        rho0 = np.zeros((N_LEVELS, N_LEVELS), dtype=complex)
+        rho0[G, G] = 1.0
+    steps = [int(round(segment["duration"] / dt)) for segment in segments]
+    n_samples = sum(steps) // save_every + 1
+
+    os.makedirs(store, exist_ok=True)
+    times = np.lib.format.open_memmap(
+        os.path.join(store, "times.npy"), mode="w+", dtype=float, shape=(n_samples,))
+    rho_t = np.lib.format.open_memmap(
+        os.path.join(store, "rho.npy"), mode="w+", dtype=complex,
+        shape=(n_samples, N_LEVELS ** 2))
+
+    buffer_times = np.empty(chunk_samples)
+    buffer_rho = np.empty((chunk_samples, N_LEVELS ** 2), dtype=complex)
+    written, buffered = 0, 0
+
+    def save(t: float, rho_vec: np.ndarray) -> None:
+        nonlocal buffered
+        buffer_times[buffered] = t
+        buffer_rho[buffered] = rho_vec
+        buffered += 1
+        if buffered == chunk_samples:
+            flush()
+
+    def flush() -> None:
+        nonlocal written, buffered
+        times[written:written + buffered] = buffer_times[:buffered]
+        rho_t[written:written + buffered] = buffer_rho[:buffered]
+        times.flush()
+        rho_t.flush()
+        written += buffered
+        buffered = 0
+
+    # Column-stacked initial state
+    rho_vec = rho0.T.reshape(-1).astype(complex)
+    step = 0
+    save(0.0, rho_vec)
+    for segment, n_steps in zip(segments, steps):
+        remaining = n_steps
+        # Steps up to the next saved sample, then whole jumps of save_every steps
+        head = min(remaining, (-step) % save_every)
+        if head:
+            rho_vec = cache.get(segment, dt, head) @ rho_vec
+            step += head
+            remaining -= head
+            if step % save_every == 0:
+                save(step * dt, rho_vec)
+        if remaining >= save_every:
+            jump = cache.get(segment, dt, save_every)
+            for _ in range(remaining // save_every):
+                rho_vec = jump @ rho_vec
+                step += save_every
+                save(step * dt, rho_vec)
+            remaining %= save_every
+        if remaining:
+            rho_vec = cache.get(segment, dt, remaining) @ rho_vec
+            step += remaining
+    flush()
+    return load_trajectory(store)
+
+
+def load_trajectory(store: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Opens a trajectory written by simulate_pulse_sequence
+
+    Args:
+        store (str): directory of the trajectory files
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            times of the saved samples
+            read-only memory map of the density matrices, shape (n_samples, n, n)
+    """
+    times = np.load(os.path.join(store, "times.npy"), mmap_mode="r")
+    rho_t = np.load(os.path.join(store, "rho.npy"), mmap_mode="r")
+    return times, unvectorize(rho_t)
+
+
+def storage_retrieval_sequence(
+    t_write: float,
+    t_store: float,
+    t_read: float,
+    Omega_p_peak: float,
+    pulse_width: float,
+    Omega_c: float,
+    dt: float,
+    amplitude_levels: int = 64
+) -> List[Segment]:
+    """
+    Builds the segments of a storage and retrieval experiment: the rising half of
+    a Gaussian probe pulse is written with the control ON, the control is switched
+    OFF at the pulse peak for the storage time, mapping the probe onto the spin
+    coherence rho_gs, and switched back ON to retrieve it. The probe envelope is
+    quantized to amplitude_levels values so its propagators are reused
+
+    Args:
+        t_write (float): duration of the write stage, the pulse peaks at t_write
+        t_store (float): storage time with both fields OFF
+        t_read (float): duration of the read stage
+        Omega_p_peak (float): peak Rabi frequency of the probe pulse
+        pulse_width (float): standard deviation of the probe pulse
+        Omega_c (float): Rabi frequency of the control laser when ON
+        dt (float): time step of the probe envelope
+        amplitude_levels (int, optional): quantization levels. Defaults to 64
+
+    Returns:
+        List[Segment]: piecewise-constant segments
+    """
+    t = (np.arange(int(round(t_write / dt))) + 0.5) * dt
+    envelope = np.exp(-0.5 * ((t - t_write) / pulse_width) ** 2)
+    envelope = np.round(envelope * (amplitude_levels - 1)) / (amplitude_levels - 1)
+    segments = [
+        {"duration": dt, "Omega_p": Omega_p_peak * value, "Omega_c": Omega_c}
+        for value in envelope
+    ]
+    segments.append({"duration": t_store, "Omega_p": 0.0, "Omega_c": 0.0})
+    segments.append({"duration": t_read, "Omega_p": 0.0, "Omega_c": Omega_c})
+    return segments
+
+
+def spin_coherence_retention(
+    times: np.ndarray,
+    rho_t: np.ndarray,
+    t_stored: float,
+    t_retrieved: float
+) -> float:
+    """
+    Fraction of the ground-storage coherence |rho_gs| kept between two instants,
+    a figure of merit of the storage fidelity of the memory
+
+    Args:
+        times (np.ndarray): times of the trajectory
+        rho_t (np.ndarray): density matrices of the trajectory
+        t_stored (float): instant when the pulse is stored (control switched OFF)
+        t_retrieved (float): instant when the control is switched back ON
+
+    Returns:
+        float: |rho_gs(t_retrieved)| / |rho_gs(t_stored)|
+    """
+    i = int(np.argmin(np.abs(times - t_stored)))
+    j = int(np.argmin(np.abs(times - t_retrieved)))
+    return float(np.abs(rho_t[j, G, S]) / np.abs(rho_t[i, G, S]))
@@ -0,0 +1,202 @@
+"""
+This module exports simulation results to append-only Parquet datasets, so that
+later analyses can query them instead of running the solvers again
+
+A dataset is a directory of Parquet part files sharing one schema. Rows are
+buffered in memory and written as a new part file every batch_rows rows, so a
+long sweep can be queried with pyarrow.dataset while it is still running and
+never holds all its results in memory. Part files are written under a hidden
+name and renamed once complete, so readers never see partial files. Every row
+carries the provenance of its run: run id, timestamp, git commit, a hash of the
+source code, the solver version and a hash of the parameters (see
+src/cache.cache_key)
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import hashlib
+import os
+import subprocess
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from src.cache import cache_key
+from src.calculations import SOLVER_VERSION
+
+# Rows buffered before a part file is written
+BATCH_ROWS: int = 100_000
+
+PROJECT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROVENANCE_SCHEMA: pa.Schema = pa.schema([
+    ("run_id", pa.string()),
+    ("timestamp", pa.timestamp("us", tz="UTC")),
+    ("git_commit", pa.string()),
+    ("code_hash", pa.string()),
+    ("solver_version", pa.string()),
+    ("params_hash", pa.string())
+])
+
+# One row per susceptibility curve of main.py
+SUSCEPTIBILITY_SCHEMA: pa.Schema = pa.schema([
+    ("method", pa.string()),
+    ("cached", pa.bool_()),
+    ("control", pa.string()),
+    ("gamma", pa.float64()),
+    ("gamma_sg", pa.float64()),
+    ("Omega_p", pa.float64()),
+    ("Omega_c", pa.float64()),
+    ("delta_p", pa.list_(pa.float64())),
+    ("chi_real", pa.list_(pa.float64())),
+    ("chi_imag", pa.list_(pa.float64())),
+    ("solve_seconds", pa.float64())
+])
+
+# One row per grid point of src/sweep.run_sweep
+SWEEP_SCHEMA: pa.Schema = pa.schema([
+    ("delta_p", pa.float64()),
+    ("Omega_c", pa.float64()),
+    ("Omega_p", pa.float64()),
+    ("gamma", pa.float64()),
+    ("gamma_sg", pa.float64()),
+    ("rho_ge_real", pa.float64()),
+    ("rho_ge_imag", pa.float64()),
+    ("chunk", pa.int64()),
+    ("solve_seconds", pa.float64())
+])
+
+
+@lru_cache(maxsize=None)
+def git_commit() -> str:
+    """
+    Commit of the working tree, "unknown" outside a git repository
+
+    Returns:
+        str: hexadecimal commit hash
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
+
+
+@lru_cache(maxsize=None)
+def code_hash() -> str:
+    """
+    SHA-256 of the Python sources of the project, which also tells apart runs of
+    uncommitted changes
+
+    Returns:
+        str: hexadecimal digest
+    """
+    digest = hashlib.sha256()
+    for folder, dirs, files in sorted(os.walk(PROJECT_DIR)):
+        dirs[:] = sorted(d for d in dirs if not d.startswith((".", "__")))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(folder, name)
+                digest.update(os.path.relpath(path, PROJECT_DIR).encode())
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ResultsWriter:
+    """
+    Buffered writer of an append-only Parquet dataset. Use it as a context
+    manager so the last rows are flushed on exit
+    """
+
+    def __init__(
+        self,
+        dataset_dir: str,
+        schema: pa.Schema,
+        params: Dict[str, Any],
+        batch_rows: int = BATCH_ROWS
+    ):
+        """
+        Args:
+            dataset_dir (str): directory of the dataset
+            schema (pa.Schema): columns of the results, without the provenance
+            params (Dict[str, Any]): parameters of the run, hashed into params_hash
+            batch_rows (int, optional): rows per part file. Defaults to BATCH_ROWS
+        """
+        self.dataset_dir = dataset_dir
+        self.schema = pa.schema(list(PROVENANCE_SCHEMA) + list(schema))
+        self.batch_rows = batch_rows
+        self.run_id = uuid.uuid4().hex
+        self.provenance = {
+            "run_id": self.run_id,
+            "git_commit": git_commit(),
+            "code_hash": code_hash(),
+            "solver_version": SOLVER_VERSION,
+            "params_hash": cache_key(params)
+        }
+        self._batches: List[pa.RecordBatch] = []
+        self._buffered = 0
+        self._parts = 0
+        os.makedirs(dataset_dir, exist_ok=True)
+
+    def append(self, columns: Dict[str, Sequence]) -> None:
+        """
+        Buffers rows, writing a part file once batch_rows rows are buffered
+
+        Args:
+            columns (Dict[str, Sequence]): equally long values of every column
+                of the schema given to the constructor
+        """
+        n_rows = len(next(iter(columns.values())))
+        values = {name: [value] * n_rows for name, value in self.provenance.items()}
+        values["timestamp"] = [datetime.now(timezone.utc)] * n_rows
+        values.update(columns)
+        self._batches.append(pa.RecordBatch.from_pydict(values, schema=self.schema))
+        self._buffered += n_rows
+        if self._buffered >= self.batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows as a new part file
+        """
+        if not self._buffered:
+            return
+        name = f"part-{self.run_id}-{self._parts:05d}.parquet"
+        # pyarrow.dataset skips hidden files, so a part becomes visible only once complete
+        tmp = os.path.join(self.dataset_dir, f".{name}")
+        pq.write_table(pa.Table.from_batches(self._batches, schema=self.schema), tmp)
+        os.replace(tmp, os.path.join(self.dataset_dir, name))
+        self._batches, self._buffered = [], 0
+        self._parts += 1
+
+    def close(self) -> None:
+        """
+        Flushes the remaining rows
+        """
+        self.flush()
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_results(dataset_dir: str) -> ds.Dataset:
+    """
+    Opens a results dataset, including the parts of runs still in progress
+
+    Args:
+        dataset_dir (str): directory of the dataset
+
+    Returns:
+        pyarrow.dataset.Dataset: lazily scanned dataset, e.g.
+            read_results(path).to_table(filter=ds.field("Omega_c") > 0.5)
+    """
+    return ds.dataset(dataset_dir, format="parquet")
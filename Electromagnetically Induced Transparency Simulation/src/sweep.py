@@ -0,0 +1,211 @@
+"""
+This module runs multi-dimensional parameter sweeps of the steady-state probe
+coherence. The grid is split into chunks that are solved in a process pool and
+streamed into a memory-mapped array store on disk, so interrupted sweeps can be
+resumed from the chunks that are still missing. Finished chunks can also be
+exported to a Parquet dataset as they complete (see src/results_store.py)
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from src import config
+from src.liouvillian import steady_state_coherence
+from src.results_store import ResultsWriter, SWEEP_SCHEMA
+
+# Axes of the sweep store, in storage order
+SWEEP_PARAMETERS: Tuple[str, ...] = ("delta_p", "Omega_c", "Omega_p", "gamma", "gamma_sg")
+CHUNK_SIZE: int = 50_000
+
+
+def _default_axes() -> Dict[str, np.ndarray]:
+    """
+    Returns the single-valued axes taken from src/config.py
+
+    Returns:
+        Dict[str, np.ndarray]: default axis of every sweep parameter
+    """
+    return {
+        "delta_p": np.asarray(config.delta_p, dtype=float),
+        "Omega_c": np.array([config.Omega_c_on]),
+        "Omega_p": np.array([config.Omega_p]),
+        "gamma": np.array([config.gamma]),
+        "gamma_sg": np.array([config.gamma_sg])
+    }
+
+
+def _open_store(store: str, axes: Dict[str, np.ndarray], chunk_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Creates the store or reopens it when the grid matches a previous run
+
+    Args:
+        store (str): directory of the store
+        axes (Dict[str, np.ndarray]): values of every axis
+        chunk_size (int): points per chunk
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: memory maps of rho_ge and the done flags
+    """
+    shape = tuple(len(axes[name]) for name in SWEEP_PARAMETERS)
+    n_chunks = -(-int(np.prod(shape)) // chunk_size)
+    grid_path = os.path.join(store, "grid.npz")
+    rho_path = os.path.join(store, "rho_ge.npy")
+    done_path = os.path.join(store, "done.npy")
+
+    if os.path.exists(grid_path):
+        with np.load(grid_path) as saved:
+            same_grid = (
+                int(saved["chunk_size"]) == chunk_size
+                and all(np.array_equal(saved[name], axes[name]) for name in SWEEP_PARAMETERS)
+            )
+        if not same_grid:
+            raise ValueError(
+                f"The store '{store}' holds a different sweep; use a new directory")
+        return np.load(rho_path, mmap_mode="r+"), np.load(done_path, mmap_mode="r+")
+
+    os.makedirs(store, exist_ok=True)
+    rho_ge = np.lib.format.open_memmap(rho_path, mode="w+", dtype=complex, shape=shape)
+    done = np.lib.format.open_memmap(done_path, mode="w+", dtype=bool, shape=(n_chunks,))
+    rho_ge.flush()
+    done.flush()
+    # The grid is written last, so a store is only reused once fully created
+    np.savez(grid_path, chunk_size=chunk_size, **axes)
+    return rho_ge, done
+
+
+def _solve_chunk(store: str, chunk: int, chunk_size: int) -> Tuple[int, float]:
+    """
+    Worker entry point: solves one chunk of the grid and writes it to the store
+
+    Args:
+        store (str): directory of the store
+        chunk (int): index of the chunk
+        chunk_size (int): points per chunk
+
+    Returns:
+        Tuple[int, float]: index of the finished chunk and its solve time in seconds
+    """
+    started = time.perf_counter()
+    with np.load(os.path.join(store, "grid.npz")) as saved:
+        axes = [saved[name] for name in SWEEP_PARAMETERS]
+    rho_ge = np.load(os.path.join(store, "rho_ge.npy"), mmap_mode="r+")
+    flat = rho_ge.reshape(-1)
+    start = chunk * chunk_size
+    stop = min(start + chunk_size, flat.size)
+    indices = np.unravel_index(np.arange(start, stop), rho_ge.shape)
+    delta_p, Omega_c, Omega_p, gamma, gamma_sg = (
+        axis[index] for axis, index in zip(axes, indices))
+    flat[start:stop] = steady_state_coherence(
+        delta_p, gamma, gamma_sg, Omega_p, Omega_c, chunk_size=chunk_size)
+    rho_ge.flush()
+    return chunk, time.perf_counter() - started
+
+
+def _chunk_columns(
+    axes: Dict[str, np.ndarray],
+    rho_ge: np.ndarray,
+    chunk: int,
+    chunk_size: int,
+    seconds: float
+) -> Dict[str, np.ndarray]:
+    """
+    Columns of src/results_store.SWEEP_SCHEMA for the points of one chunk
+
+    Args:
+        axes (Dict[str, np.ndarray]): axes of the sweep
+        rho_ge (np.ndarray): memory map of the store
+        chunk (int): index of the chunk
+        chunk_size (int): points per chunk
+        seconds (float): solve time of the chunk
+
+    Returns:
+        Dict[str, np.ndarray]: one value per point of the chunk
+    """
+    start = chunk * chunk_size
+    stop = min(start + chunk_size, rho_ge.size)
+    indices = np.unravel_index(np.arange(start, stop), rho_ge.shape)
+    values = np.asarray(rho_ge.reshape(-1)[start:stop])
+    columns = {name: axes[name][index] for name, index in zip(SWEEP_PARAMETERS, indices)}
+    columns.update({
+        "rho_ge_real": values.real,
+        "rho_ge_imag": values.imag,
+        "chunk": np.full(stop - start, chunk),
+        "solve_seconds": np.full(stop - start, seconds)
+    })
+    return columns
+
+
+def run_sweep(
+    store: str,
+    chunk_size: int = CHUNK_SIZE,
+    n_workers: Optional[int] = None,
+    results_dir: Optional[str] = None,
+    **grid: Sequence[float]
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Sweeps the steady-state coherence rho_ge over the Cartesian product of the
+    given axes. Parameters that are not given keep their value in src/config.py.
+    Calling it again with the same store and grid resumes the missing chunks
+
+    Args:
+        store (str): directory of the memory-mapped store
+        chunk_size (int, optional): points per chunk. Defaults to CHUNK_SIZE
+        n_workers (int, optional): worker processes. Defaults to os.cpu_count()
+        results_dir (str, optional): Parquet dataset the chunks solved by this
+            call are appended to, one part file per chunk. Defaults to None
+        **grid (Sequence[float]): values of any of SWEEP_PARAMETERS
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], np.ndarray]:
+            axes of the sweep, in SWEEP_PARAMETERS order
+            read-only memory map of rho_ge with one dimension per axis
+    """
+    unknown = set(grid) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+    axes = _default_axes()
+    axes.update({name: np.atleast_1d(np.asarray(values, dtype=float)) for name, values in grid.items()})
+
+    rho_ge, done = _open_store(store, axes, chunk_size)
+    pending = np.flatnonzero(~done).tolist()
+    writer = None
+    if pending and results_dir is not None:
+        writer = ResultsWriter(
+            results_dir, SWEEP_SCHEMA, {**axes, "chunk_size": chunk_size}, batch_rows=chunk_size)
+    if pending:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_solve_chunk, store, chunk, chunk_size) for chunk in pending]
+            for future in as_completed(futures):
+                chunk, seconds = future.result()
+                done[chunk] = True
+                done.flush()
+                if writer is not None:
+                    writer.append(_chunk_columns(axes, rho_ge, chunk, chunk_size, seconds))
+        if writer is not None:
+            writer.close()
+    return load_sweep(store)
+
+
+def load_sweep(store: str) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Opens a sweep store written by run_sweep
+
+    Args:
+        store (str): directory of the store
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], np.ndarray]:
+            axes of the sweep, in SWEEP_PARAMETERS order
+            read-only memory map of rho_ge with one dimension per axis
+    """
+    with np.load(os.path.join(store, "grid.npz")) as saved:
+        axes = {name: saved[name] for name in SWEEP_PARAMETERS}
+    done = np.load(os.path.join(store, "done.npy"))
+    if not done.all():
+        print(f"Warning: sweep incomplete, {int((~done).sum())} of {done.size} chunks missing")
+    return axes, np.load(os.path.join(store, "rho_ge.npy"), mmap_mode="r")
@@ -0,0 +1,170 @@
+"""
+Script to animate precomputed EIT results: streams the frames of a frame store
+written by src/frames.py of the EIT simulation (a control power sweep or a
+storage and retrieval pulse) from memory-mapped files, one data frame per video
+frame. The axes, curves and population bars are created once and their points
+are updated in place every frame
+
+The scene is configured with environment variables, since the manim command line
+does not forward arguments to scenes:
+    EIT_FRAMES: directory of the frame store (default: frames)
+    EIT_FRAME_START, EIT_FRAME_STOP: range of frames to render, so a long
+        animation can be rendered in independent segments (see render_segments.py)
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import json
+import os
+from typing import Dict, Tuple
+import numpy as np
+from manim import *
+
+# Points drawn per curve; frame stores are usually much finer
+MAX_CURVE_POINTS: int = 400
+LEVEL_LABELS: Tuple[str, ...] = ("g", "e", "s")
+PARAMETER_LABELS: Dict[str, str] = {
+    "Omega_c": r"\Omega_c / \gamma",
+    "t": r"t \, \gamma"
+}
+
+
+def load_frame_store(store: str) -> Tuple[dict, Dict[str, np.ndarray]]:
+    """
+    Opens a frame store of the EIT simulation read-only
+
+    Args:
+        store (str): directory of the frame files
+
+    Returns:
+        Tuple[dict, Dict[str, np.ndarray]]:
+            metadata of the store
+            memory maps of x, chi, populations and parameter
+    """
+    with open(os.path.join(store, "meta.json")) as f:
+        meta = json.load(f)
+    arrays = {
+        name: np.load(os.path.join(store, f"{name}.npy"), mmap_mode="r")
+        for name in ("x", "chi", "populations", "parameter")
+    }
+    return meta, arrays
+
+
+def frame_range(n_frames: int) -> Tuple[int, int]:
+    """
+    Range of frames selected by EIT_FRAME_START and EIT_FRAME_STOP
+
+    Args:
+        n_frames (int): frames in the store
+
+    Returns:
+        Tuple[int, int]: first frame and end of the range
+    """
+    start = int(os.environ.get("EIT_FRAME_START", 0))
+    stop = int(os.environ.get("EIT_FRAME_STOP", n_frames))
+    start, stop = max(0, start), min(n_frames, stop)
+    if start >= stop:
+        raise ValueError(f"Empty frame range [{start}, {stop}) of a store with {n_frames} frames")
+    return start, stop
+
+
+def _axis_step(low: float, high: float) -> float:
+    """
+    Tick spacing giving about four ticks over a range
+    """
+    span = high - low
+    return span / 4 if span > 0 else 1.0
+
+
+class EITFrames(Scene):
+    def construct(self):
+        meta, frames = load_frame_store(os.environ.get("EIT_FRAMES", "frames"))
+        start, stop = frame_range(meta["n_frames"])
+
+        # Curves are drawn with a fixed subset of the points of the store
+        x = np.asarray(frames["x"])
+        keep = np.unique(np.linspace(0, len(x) - 1, min(len(x), MAX_CURVE_POINTS)).astype(int))
+        x = x[keep]
+
+        # Limits of the whole store, so that every segment draws the same axes
+        x_low, x_high = meta["x_range"]
+        chi_low, chi_high = meta["chi_range"]
+        margin = 0.05 * (chi_high - chi_low or 1.0)
+        y_low, y_high = chi_low - margin, chi_high + margin
+        axes = Axes(
+            x_range=[x_low, x_high, _axis_step(x_low, x_high)],
+            y_range=[y_low, y_high, _axis_step(y_low, y_high)],
+            x_length=8,
+            y_length=5,
+            tips=False,
+            axis_config={"include_numbers": False}
+        ).to_edge(LEFT)
+        x_label = MathTex(r"\delta_p / \gamma" if meta["kind"] == "control-sweep" else r"\tau \, \gamma")
+        x_label.scale(0.7).next_to(axes, DOWN)
+
+        # Affine map from data to scene coordinates, applied to whole curves at once
+        origin = axes.c2p(x_low, y_low)
+        unit_x = axes.c2p(x_low + 1.0, y_low) - origin
+        unit_y = axes.c2p(x_low, y_low + 1.0) - origin
+        base = origin + np.outer(x - x_low, unit_x)
+
+        def curve_points(y: np.ndarray) -> np.ndarray:
+            return base + np.outer(y - y_low, unit_y)
+
+        tracker = ValueTracker(start)
+
+        def frame() -> int:
+            return min(int(round(tracker.get_value())), stop - 1)
+
+        def chi() -> np.ndarray:
+            return np.asarray(frames["chi"][frame()])[keep]
+
+        re_curve = VMobject(color=BLUE).set_points_as_corners(curve_points(chi().real))
+        im_curve = VMobject(color=ORANGE).set_points_as_corners(curve_points(chi().imag))
+        re_curve.add_updater(lambda m: m.set_points_as_corners(curve_points(chi().real)))
+        im_curve.add_updater(lambda m: m.set_points_as_corners(curve_points(chi().imag)))
+        legend = VGroup(
+            MathTex(r"\mathrm{Re}[\chi^{(1)}]", color=BLUE),
+            MathTex(r"\mathrm{Im}[\chi^{(1)}]", color=ORANGE)
+        ).arrange(DOWN, aligned_edge=LEFT).scale(0.6).next_to(axes, UP, aligned_edge=RIGHT)
+
+        # Population bars, stretched in place from a fixed baseline
+        bar_height = 4.0
+        baseline = Line(LEFT * 1.2, RIGHT * 1.2).to_edge(RIGHT).shift(DOWN * 2.5)
+        bars = VGroup(*[
+            Rectangle(width=0.5, height=bar_height, color=color, fill_opacity=0.8)
+            for color in (BLUE, RED, GREEN)
+        ]).arrange(RIGHT, buff=0.25)
+        bars.move_to(baseline.get_center(), aligned_edge=DOWN)
+        bottoms = [bar.get_bottom() for bar in bars]
+        level_labels = VGroup(*[
+            MathTex(rf"\rho_{{{level}{level}}}").scale(0.6).next_to(bottom, DOWN)
+            for level, bottom in zip(LEVEL_LABELS, bottoms)
+        ])
+
+        def update_bars(group: VGroup) -> None:
+            populations = np.clip(frames["populations"][frame()], 0.0, 1.0)
+            for bar, bottom, population in zip(group, bottoms, populations):
+                # A zero-height rectangle cannot be stretched back
+                bar.stretch_to_fit_height(max(float(population), 1e-3) * bar_height)
+                bar.move_to(bottom, aligned_edge=DOWN)
+
+        update_bars(bars)
+        bars.add_updater(update_bars)
+
+        parameter = DecimalNumber(frames["parameter"][start], num_decimal_places=3)
+        parameter_label = MathTex(PARAMETER_LABELS.get(meta["parameter"], meta["parameter"]) + " =")
+        readout = VGroup(parameter_label, parameter).arrange(RIGHT).scale(0.7).to_corner(UR)
+        parameter.add_updater(lambda m: m.set_value(float(frames["parameter"][frame()])))
+
+        # Everything is added without an intro animation, so segments join seamlessly
+        self.add(axes, x_label, legend, re_curve, im_curve, baseline, bars, level_labels, readout)
+        # manim renders the frames at t = k / frame_rate for t < run_time: half a
+        # frame short of stop - start frames gives exactly that many, and video
+        # frame k shows data frame start + k
+        self.play(
+            tracker.animate.set_value(stop - 0.5),
+            run_time=(stop - start - 0.5) / config.frame_rate,
+            rate_func=linear
+        )
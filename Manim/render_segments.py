@@ -0,0 +1,176 @@
+"""
+Script to render a long data-driven EIT animation (eit_data_visualization.py) in
+independent segments. Every segment is a separate manim process rendering a range
+of frames of the store, the processes run in parallel, and the segment videos are
+joined with the ffmpeg concat demuxer without re-encoding
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+SCENE_FILE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eit_data_visualization.py")
+SCENE: str = "EITFrames"
+QUALITIES: Tuple[str, ...] = ("l", "m", "h", "p", "k")
+
+
+def segment_ranges(n_frames: int, n_segments: int) -> List[Tuple[int, int]]:
+    """
+    Splits the frames of a store into contiguous, nearly equal ranges
+
+    Args:
+        n_frames (int): frames in the store
+        n_segments (int): number of segments
+
+    Returns:
+        List[Tuple[int, int]]: (start, stop) of every non-empty segment
+    """
+    bounds = [round(k * n_frames / n_segments) for k in range(n_segments + 1)]
+    return [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def render_segment(
+    frames: str,
+    start: int,
+    stop: int,
+    name: str,
+    media_dir: str,
+    quality: str = "l"
+) -> str:
+    """
+    Renders one range of frames in its own manim process, with its own media
+    directory so the partial movie files of concurrent processes never collide
+
+    Args:
+        frames (str): directory of the frame store
+        start (int): first frame
+        stop (int): end of the range
+        name (str): file name of the segment video, without extension
+        media_dir (str): parent of the media directory of the segment
+        quality (str, optional): one of QUALITIES. Defaults to "l"
+
+    Returns:
+        str: path of the segment video
+    """
+    media_dir = os.path.join(media_dir, name)
+    env = dict(os.environ)
+    env.update({
+        "EIT_FRAMES": os.path.abspath(frames),
+        "EIT_FRAME_START": str(start),
+        "EIT_FRAME_STOP": str(stop)
+    })
+    subprocess.run(
+        ["manim", "render", f"-q{quality}", "--disable_caching", "--media_dir", media_dir,
+         "-o", name, SCENE_FILE, SCENE],
+        env=env, check=True, stdout=subprocess.DEVNULL)
+    # manim places the video in a folder named after the scene file and the quality
+    videos = glob.glob(os.path.join(media_dir, "videos", "*", "*", f"{name}.mp4"))
+    if not videos:
+        raise FileNotFoundError(f"manim did not write {name}.mp4 under {media_dir}")
+    return videos[0]
+
+
+def concatenate(videos: List[str], output: str) -> str:
+    """
+    Joins videos of identical encoding with the ffmpeg concat demuxer
+
+    Args:
+        videos (List[str]): segment videos, in order
+        output (str): joined video file
+
+    Returns:
+        str: the joined video file
+    """
+    playlist = f"{output}.txt"
+    with open(playlist, "w") as f:
+        for video in videos:
+            f.write(f"file '{os.path.abspath(video)}'\n")
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", playlist, "-c", "copy", output],
+        check=True)
+    os.remove(playlist)
+    return output
+
+
+def render_segments(
+    frames: str,
+    output: str,
+    n_segments: int = 8,
+    n_workers: Optional[int] = None,
+    quality: str = "l",
+    media_dir: str = "media"
+) -> str:
+    """
+    Renders a frame store in parallel segments and joins them into one video
+
+    Args:
+        frames (str): directory of the frame store
+        output (str): joined video file
+        n_segments (int, optional): number of segments. Defaults to 8
+        n_workers (int, optional): manim processes running at once; None uses
+            os.cpu_count(). Defaults to None
+        quality (str, optional): one of QUALITIES. Defaults to "l"
+        media_dir (str, optional): parent of the segment media directories.
+            Defaults to "media"
+
+    Returns:
+        str: the joined video file
+    """
+    if quality not in QUALITIES:
+        raise ValueError(f"Unknown quality '{quality}', expected one of {QUALITIES}")
+    with open(os.path.join(frames, "meta.json")) as f:
+        n_frames = json.load(f)["n_frames"]
+    ranges = segment_ranges(n_frames, n_segments)
+    # The rendering happens in the manim processes, threads only wait for them
+    with ThreadPoolExecutor(max_workers=n_workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(render_segment, frames, start, stop, f"segment_{k:04d}", media_dir, quality)
+            for k, (start, stop) in enumerate(ranges)
+        ]
+        videos = [future.result() for future in futures]
+    return concatenate(videos, output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Parallel segmented rendering of the data-driven EIT animation.")
+    parser.add_argument(
+        "frames",
+        type=str,
+        help="Frame store written by src/frames.py of the EIT simulation"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="EITFrames.mp4",
+        help="Joined video file (default value: EITFrames.mp4)"
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=8,
+        help="Number of independent segments (default value: 8)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Manim processes running at once (default value: number of CPUs)"
+    )
+    parser.add_argument(
+        "--quality",
+        choices=QUALITIES,
+        default="l",
+        help="Manim render quality (default value: l)"
+    )
+    args = parser.parse_args()
+    output = render_segments(args.frames, args.output, args.segments, args.workers, args.quality)
+    print(f"Animation written to {output}")
@@ -0,0 +1,304 @@
+"""
+Script to inspect large collections of many-qubit states: computes the reduced
+single-qubit Bloch vectors of every state with vectorized partial traces and
+renders them as contact sheets or per-state images in a process pool
+
+States are read from a .npy file holding statevectors (m, 2^n) or density
+matrices (m, 2^n, 2^n), e.g. the states of a qDB circuit after each Grover stage
+(see stage_states). States whose Bloch vectors did not change since the last
+render of the same output directory are not rendered again, and repeated states
+within a batch are drawn once and saved under their own labels
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+from qiskit.visualization import plot_bloch_vector
+
+LAYOUTS: Tuple[str, ...] = ("sheet", "states")
+# States per contact sheet
+SHEET_SIZE: int = 16
+# Bloch vectors closer than this are considered unchanged
+ATOL: float = 1e-6
+
+
+def stage_states(qc: QuantumCircuit) -> np.ndarray:
+    """
+    Statevectors of a circuit after each of its top-level instructions, e.g.
+    after every stage of a Grover search. Measurements and barriers are skipped
+
+    Args:
+        qc (QuantumCircuit): circuit to follow
+
+    Returns:
+        np.ndarray: statevectors of shape (n_stages + 1, 2^n), initial state first
+    """
+    state = Statevector.from_label("0" * qc.num_qubits)
+    states = [state.data]
+    for instruction in qc.data:
+        operation = instruction.operation
+        if operation.name in ("measure", "barrier", "reset"):
+            continue
+        qargs = [qc.find_bit(qubit).index for qubit in instruction.qubits]
+        state = state.evolve(operation, qargs=qargs)
+        states.append(state.data)
+    return np.array(states)
+
+
+def bloch_vectors(states: np.ndarray, qubits: Optional[Sequence[int]] = None) -> np.ndarray:
+    """
+    Reduced single-qubit Bloch vectors of a batch of states, from the partial
+    traces of all states at once. Qubit 0 is the least significant bit, as in Qiskit
+
+    Args:
+        states (np.ndarray): statevectors (m, 2^n) or density matrices (m, 2^n, 2^n)
+        qubits (Sequence[int], optional): qubits to reduce to. Defaults to all
+
+    Returns:
+        np.ndarray: Bloch vectors of shape (m, len(qubits), 3)
+    """
+    states = np.asarray(states, dtype=complex)
+    m, dim = states.shape[:2]
+    n = int(round(np.log2(dim)))
+    if qubits is None:
+        qubits = range(n)
+    vectors = np.empty((m, len(qubits), 3))
+    for k, qubit in enumerate(qubits):
+        axis = n - 1 - qubit
+        if states.ndim == 2:
+            psi = np.moveaxis(states.reshape((m,) + (2,) * n), axis + 1, 1).reshape(m, 2, -1)
+            rho = psi @ psi.conj().transpose(0, 2, 1)
+        else:
+            full = states.reshape((m,) + (2,) * (2 * n))
+            full = np.moveaxis(full, (axis + 1, n + axis + 1), (1, 2))
+            rest = 2 ** (n - 1)
+            rho = np.einsum("mabrr->mab", full.reshape(m, 2, 2, rest, rest))
+        vectors[:, k, 0] = 2 * rho[:, 0, 1].real
+        vectors[:, k, 1] = -2 * rho[:, 0, 1].imag
+        vectors[:, k, 2] = (rho[:, 0, 0] - rho[:, 1, 1]).real
+    return vectors
+
+
+def changed_states(
+    vectors: np.ndarray,
+    previous: Optional[np.ndarray],
+    atol: float = ATOL
+) -> np.ndarray:
+    """
+    Flags the states whose Bloch vectors differ from a previous render
+
+    Args:
+        vectors (np.ndarray): Bloch vectors of shape (m, n_qubits, 3)
+        previous (np.ndarray, optional): Bloch vectors of the previous render
+        atol (float, optional): absolute tolerance. Defaults to ATOL
+
+    Returns:
+        np.ndarray: boolean mask of shape (m,)
+    """
+    changed = np.ones(len(vectors), dtype=bool)
+    if previous is not None and previous.shape[1:] == vectors.shape[1:]:
+        common = min(len(vectors), len(previous))
+        same = np.isclose(vectors[:common], previous[:common], atol=atol).all(axis=(1, 2))
+        changed[:common] = ~same
+    return changed
+
+
+def _draw_row(
+    fig: plt.Figure,
+    grid: Tuple[int, int],
+    row: int,
+    vectors: np.ndarray,
+    label: str,
+    qubits: Sequence[int]
+) -> None:
+    """
+    Draws the Bloch spheres of one state on a row of a subplot grid
+
+    Args:
+        fig (Figure): figure to draw on
+        grid (Tuple[int, int]): rows and columns of the grid
+        row (int): row of the state
+        vectors (np.ndarray): Bloch vectors of the state, shape (n_qubits, 3)
+        label (str): title of the first sphere
+        qubits (Sequence[int]): index of the qubit of every sphere
+    """
+    for k, (vector, qubit) in enumerate(zip(vectors, qubits)):
+        ax = fig.add_subplot(grid[0], grid[1], row * grid[1] + k + 1, projection="3d")
+        plot_bloch_vector(vector, title=f"{label} q{qubit}" if k == 0 else f"q{qubit}", ax=ax)
+
+
+def render_states(vectors: np.ndarray, labels: List[str], filename: str, qubits: Sequence[int]) -> str:
+    """
+    Renders the Bloch spheres of several states, one row per state, to a file
+
+    Args:
+        vectors (np.ndarray): Bloch vectors of shape (m, n_qubits, 3)
+        labels (List[str]): label of every state
+        filename (str): image file
+        qubits (Sequence[int]): index of the qubit of every sphere
+
+    Returns:
+        str: the image file
+    """
+    matplotlib.use("Agg")
+    grid = (len(vectors), vectors.shape[1])
+    fig = plt.figure(figsize=(2.5 * grid[1], 2.5 * grid[0]))
+    for row, (state_vectors, label) in enumerate(zip(vectors, labels)):
+        _draw_row(fig, grid, row, state_vectors, label, qubits)
+    fig.savefig(filename, format="png", dpi=150)
+    plt.close(fig)
+    return filename
+
+
+def render_copies(
+    vectors: np.ndarray,
+    labels: List[str],
+    filenames: List[str],
+    qubits: Sequence[int]
+) -> List[str]:
+    """
+    Renders the Bloch spheres of a single state to several files, drawing the
+    spheres once and only changing the title of the first one per file
+
+    Args:
+        vectors (np.ndarray): Bloch vectors of shape (1, n_qubits, 3)
+        labels (List[str]): label of every file
+        filenames (List[str]): image files
+        qubits (Sequence[int]): index of the qubit of every sphere
+
+    Returns:
+        List[str]: the image files
+    """
+    matplotlib.use("Agg")
+    grid = (1, vectors.shape[1])
+    fig = plt.figure(figsize=(2.5 * grid[1], 2.5 * grid[0]))
+    _draw_row(fig, grid, 0, vectors[0], labels[0], qubits)
+    for label, filename in zip(labels, filenames):
+        fig.axes[0].title.set_text(f"{label} q{qubits[0]}")
+        fig.savefig(filename, format="png", dpi=150)
+    plt.close(fig)
+    return filenames
+
+
+def render_batch(
+    vectors: np.ndarray,
+    output_dir: str,
+    layout: str = "sheet",
+    sheet_size: int = SHEET_SIZE,
+    n_workers: Optional[int] = None,
+    atol: float = ATOL,
+    qubits: Optional[Sequence[int]] = None
+) -> List[str]:
+    """
+    Renders contact sheets or one image per state in a process pool, skipping
+    the states whose Bloch vectors are unchanged since the last render of
+    output_dir, and rendering repeated states once
+
+    Args:
+        vectors (np.ndarray): Bloch vectors of shape (m, n_qubits, 3)
+        output_dir (str): directory of the images and of bloch_vectors.npy
+        layout (str, optional): "sheet" (sheet_size states per image) or
+            "states" (one image per state). Defaults to "sheet"
+        sheet_size (int, optional): states per contact sheet. Defaults to SHEET_SIZE
+        n_workers (int, optional): worker processes; None uses os.cpu_count().
+            Defaults to None
+        atol (float, optional): tolerance of unchanged vectors. Defaults to ATOL
+        qubits (Sequence[int], optional): qubits the vectors were reduced to,
+            shown in the titles. Defaults to 0..n_qubits-1
+
+    Returns:
+        List[str]: images written by this call
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{layout}', expected one of {LAYOUTS}")
+    os.makedirs(output_dir, exist_ok=True)
+    qubits = list(range(vectors.shape[1]) if qubits is None else qubits)
+    manifest = os.path.join(output_dir, "bloch_vectors.npy")
+    qubits_manifest = os.path.join(output_dir, "bloch_qubits.npy")
+    previous = np.load(manifest) if os.path.exists(manifest) else None
+    # Titles name the qubits, so another selection redraws every image
+    if not os.path.exists(qubits_manifest) or np.load(qubits_manifest).tolist() != qubits:
+        previous = None
+    changed = changed_states(vectors, previous, atol)
+    labels = [f"#{i}" for i in range(len(vectors))]
+
+    if layout == "states":
+        render = render_copies
+        names = [os.path.join(output_dir, f"state_{i:06d}.png") for i in range(len(vectors))]
+        # Repeated states are drawn once and saved with the label of every copy
+        keys = np.round(vectors / atol).astype(np.int64).reshape(len(vectors), -1)
+        groups = {}
+        for i in range(len(vectors)):
+            if changed[i] or not os.path.exists(names[i]):
+                groups.setdefault(keys[i].tobytes(), []).append(i)
+        tasks = [
+            (vectors[group[0]:group[0] + 1], [labels[i] for i in group], [names[i] for i in group], qubits)
+            for group in groups.values()
+        ]
+    else:
+        render = render_states
+        tasks = []
+        for start in range(0, len(vectors), sheet_size):
+            name = os.path.join(output_dir, f"sheet_{start // sheet_size:05d}.png")
+            if changed[start:start + sheet_size].any() or not os.path.exists(name):
+                tasks.append((
+                    vectors[start:start + sheet_size], labels[start:start + sheet_size], name, qubits))
+
+    if n_workers == 1:
+        written = [render(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            written = list(executor.map(render, *zip(*tasks))) if tasks else []
+    if layout == "states":
+        written = [name for names_written in written for name in names_written]
+    np.save(manifest, vectors)
+    np.save(qubits_manifest, np.array(qubits, dtype=np.int64))
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Batch Bloch sphere rendering of many-qubit states.")
+    parser.add_argument(
+        "states",
+        type=str,
+        help=".npy file with statevectors (m, 2^n) or density matrices (m, 2^n, 2^n)"
+    )
+    parser.add_argument(
+        "--qubits",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Qubits to show, e.g. the query register (default: all)"
+    )
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="sheet",
+        help="Contact sheets or one image per state (default value: sheet)"
+    )
+    parser.add_argument(
+        "--output_dir",
+        type=str,
+        default="bloch_batch",
+        help="Directory of the images (default value: bloch_batch)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default value: number of CPUs)"
+    )
+    args = parser.parse_args()
+    vectors = bloch_vectors(np.load(args.states, mmap_mode="r"), args.qubits)
+    written = render_batch(vectors, args.output_dir, args.layout, n_workers=args.workers, qubits=args.qubits)
+    print(f"{len(written)} images written to {args.output_dir}")
@@ -6,14 +6,19 @@ Date: 06/12/2024
 Version: 0.0.1
 """
 import argparse
-from src.classical_data import generate_normalized_inputs
+import time
+from typing import Optional
+from src.classical_data import generate_normalized_inputs, columns_to_inputs, normalize_inputs
 from src.quantum_circuit import create_quantum_circuit, simulate_circuit
+from src.synthetic_data import generate_synthetic_payroll
+from src.sharding import SHARD_SIZE, simulate_sharded
+from src.results_store import RESULTS_DIR, QUERY_SCHEMA, ResultsWriter, counts_columns
 from qiskit.visualization import plot_histogram
 from plots.plot_generator import generate_histogram_plot
 import matplotlib.pyplot as plt
 
 
-def main(equal_department=4, save=True):
+def main(equal_department=4, save=True, departments=SHARD_SIZE, results_dir: Optional[str] = RESULTS_DIR):
     """
     Function to generate salary data by department and execute a
     classical and quantum circuit to find the department with equal pay
@@ -22,14 +27,55 @@ def main(equal_department=4, save=True):
         equal_department (int, optional): Forces a department to be equal
         to check the same solution in classical and in quantum. Defaults to 4
         save (bool, optional): Save the plot as an image. Defaults to True
+        departments (int, optional): Number of departments. Tables larger than
+        one address register are simulated in shards. Defaults to 4
+        results_dir (str, optional): Parquet dataset the counts, parameters,
+        timings and provenance of the query are appended to; None disables
+        it. Defaults to RESULTS_DIR
     """
-    normalized_inputs, equal_departments = generate_normalized_inputs(
-        equal_department=equal_department
-    )
+    shots = 1000
+    started = time.perf_counter()
+    if departments > SHARD_SIZE:
+        columns, equal_departments = generate_synthetic_payroll(
+            n_employees=3 * departments,
+            n_departments=departments,
+            equal_departments=[equal_department]
+        )
+        print("Department with equal pay:", equal_departments)
+        ids = list(range(1, departments + 1))
+        normalized_inputs = normalize_inputs(columns_to_inputs(columns, ids))
+        built = time.perf_counter()
+        merged, found = simulate_sharded(normalized_inputs, ids, shots=shots)
+        print("Sharded simulation results:", merged)
+        print("Departments found by the shards:", found)
+        counts = {str(department): count for department, count in sorted(merged.items())}
+    else:
+        normalized_inputs, equal_departments = generate_normalized_inputs(
+            equal_department=equal_department
+        )
 
-    qc = create_quantum_circuit(normalized_inputs)
-    counts = simulate_circuit(qc)
-    print("Simulation results:", counts)
+        qc = create_quantum_circuit(normalized_inputs)
+        built = time.perf_counter()
+        counts = simulate_circuit(qc, shots=shots)
+        print("Simulation results:", counts)
+        # Same criterion as the shards: the address measured in most shots
+        found = sorted(int(address, 2) + 1 for address, count in counts.items() if count / shots > 0.5)
+    simulated = time.perf_counter()
+
+    if results_dir is not None:
+        mode = "sharded" if departments > SHARD_SIZE else "single"
+        params = {
+            "equal_department": equal_department, "departments": departments,
+            "shots": shots, "mode": mode
+        }
+        with ResultsWriter(results_dir, QUERY_SCHEMA, params) as writer:
+            writer.append({
+                **params,
+                **counts_columns(counts),
+                "found": found,
+                "build_seconds": built - started,
+                "simulate_seconds": simulated - built
+            })
 
     generate_histogram_plot(counts, save=save)
     plt.show()
@@ -57,9 +103,31 @@ if __name__ == "__main__":
         action="store_false",
         help="Do not save the plot as an image"
     )
+    parser.add_argument(
+        "--departments",
+        type=int,
+        default=SHARD_SIZE,
+        help="Number of departments; more than 4 runs the sharded mode "
+        "on synthetic data (default value: 4)"
+    )
+    parser.add_argument(
+        "--results_dir",
+        type=str,
+        default=RESULTS_DIR,
+        help=f"Parquet dataset the results of the query are appended to (default value: {RESULTS_DIR})"
+    )
+    parser.add_argument(
+        "--no-results",
+        dest="results_dir",
+        action="store_const",
+        const=None,
+        help="Do not append the results to the Parquet dataset"
+    )
     parser.set_defaults(save=True)
     args = parser.parse_args()
     main(
         args.equal_department,
-        save=args.save
+        save=args.save,
+        departments=args.departments,
+        results_dir=args.results_dir
         )
@@ -9,7 +9,7 @@ Version: 0.0.1
 """
 import pandas as pd
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from sklearn.preprocessing import MinMaxScaler
 
 
@@ -31,9 +31,11 @@ def generate_normalized_inputs(
             normalized inputs for simulation
             list of departments with equal pay
     """
-    np.random.seed(seed)
-    man = np.random.randint(1000, 5000, 12)
-    female = np.random.randint(1000, 5000, 12)
+    # Local legacy stream: same draws as seeding the global RNG, without
+    # touching global state (see src/synthetic_data.py for large datasets)
+    rng = np.random.RandomState(seed)
+    man = rng.randint(1000, 5000, 12)
+    female = rng.randint(1000, 5000, 12)
     Departments = np.tile([1, 2, 3, 4], 3)
 
     df = pd.DataFrame({
@@ -63,11 +65,63 @@ def generate_normalized_inputs(
         vector = list(man) + list(female)
         inputs.append(vector)
 
+    return normalize_inputs(inputs), equal_departments
+
+
+def normalize_inputs(inputs: List[List[int]]) -> List[List[int]]:
+    """
+    Scales the salary vectors of every department to the range used by the
+    quantum simulation
+
+    Args:
+        inputs (List[List[int]]): man salaries followed by female salaries per department
+
+    Returns:
+        List[List[int]]: normalized inputs for simulation
+    """
     flattened = np.array(inputs).flatten()
     scaler = MinMaxScaler(feature_range=(1, 15))
     scaler.fit(flattened.reshape(-1, 1))
-    normalized_inputs = [
+    return [
         scaler.transform(np.array(vec).reshape(-1, 1)).flatten().round().astype(int).tolist()
         for vec in inputs
     ]
-    return normalized_inputs, equal_departments
+
+
+def columns_to_inputs(
+    columns: Dict[str, np.ndarray],
+    departments: List[int],
+    entries: int = 3,
+    chunk_size: int = 1_000_000
+    ) -> List[List[int]]:
+    """
+    Builds the per-department salary vectors of the quantum database from
+    columnar data, taking the first entries rows of each department
+
+    Args:
+        columns (Dict[str, np.ndarray]): columns "man", "female" and "department"
+        departments (List[int]): departments to encode, in address order
+        entries (int, optional): rows per department. Defaults to 3
+        chunk_size (int, optional): rows scanned at a time. Defaults to 1_000_000
+
+    Returns:
+        List[List[int]]: man salaries followed by female salaries per department
+    """
+    rows: Dict[int, List[int]] = {d: [] for d in departments}
+    for start in range(0, len(columns["department"]), chunk_size):
+        chunk = np.asarray(columns["department"][start:start + chunk_size])
+        for department, found in rows.items():
+            missing = entries - len(found)
+            if missing > 0:
+                found.extend((start + np.flatnonzero(chunk == department)[:missing]).tolist())
+        if all(len(found) == entries for found in rows.values()):
+            break
+    inputs = []
+    for department in departments:
+        if len(rows[department]) < entries:
+            raise ValueError(f"Department {department} has fewer than {entries} rows")
+        index = np.array(rows[department])
+        inputs.append(
+            np.asarray(columns["man"][index]).tolist()
+            + np.asarray(columns["female"][index]).tolist())
+    return inputs
@@ -0,0 +1,221 @@
+"""
+This module implements the classical baseline for the equal pay queries. It keeps
+a precomputed per-department aggregate index over the salary columns that is
+updated incrementally, so the queries never scan the raw rows
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from typing import Callable, Dict, List, Tuple, Union
+import numpy as np
+
+ArrayLike = Union[int, np.ndarray, List[int]]
+
+
+class DepartmentIndex:
+    """
+    Aggregate index with the total man salary, total female salary and number
+    of rows of every department. Departments are looked up through a hash
+    table that maps the department id to a slot of the aggregate arrays
+    """
+
+    def __init__(self) -> None:
+        self._slots: Dict[int, int] = {}
+        self._departments = np.zeros(0, dtype=np.int64)
+        self._man = np.zeros(0, dtype=np.int64)
+        self._female = np.zeros(0, dtype=np.int64)
+        self._count = np.zeros(0, dtype=np.int64)
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, np.ndarray],
+        chunk_size: int = 10_000_000
+        ) -> "DepartmentIndex":
+        """
+        Builds the index from salary columns, reading them in chunks so that
+        memory-mapped datasets are never loaded at once
+
+        Args:
+            columns (Dict[str, np.ndarray]): columns "man", "female" and "department"
+            chunk_size (int, optional): rows per chunk. Defaults to 10_000_000
+
+        Returns:
+            DepartmentIndex: the populated index
+        """
+        index = cls()
+        for start in range(0, len(columns["department"]), chunk_size):
+            stop = start + chunk_size
+            index.insert(
+                columns["department"][start:stop],
+                columns["man"][start:stop],
+                columns["female"][start:stop]
+            )
+        return index
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _slot(self, department: int) -> int:
+        """
+        Returns the slot of a department, allocating it if it is new
+
+        Args:
+            department (int): department id
+
+        Returns:
+            int: position of the department in the aggregate arrays
+        """
+        slot = self._slots.get(department)
+        if slot is None:
+            slot = len(self._slots)
+            self._slots[department] = slot
+            if slot == len(self._man):
+                capacity = max(4, 2 * len(self._man))
+                self._departments = np.resize(self._departments, capacity)
+                self._man = np.resize(self._man, capacity)
+                self._female = np.resize(self._female, capacity)
+                self._count = np.resize(self._count, capacity)
+                self._man[slot:] = self._female[slot:] = self._count[slot:] = 0
+            self._departments[slot] = department
+        return slot
+
+    def insert(self, department: ArrayLike, man: ArrayLike, female: ArrayLike) -> None:
+        """
+        Adds one or many rows to the aggregates
+
+        Args:
+            department (ArrayLike): department id of each row
+            man (ArrayLike): man salary of each row
+            female (ArrayLike): female salary of each row
+        """
+        self._accumulate(department, man, female, 1)
+
+    def remove(self, department: ArrayLike, man: ArrayLike, female: ArrayLike) -> None:
+        """
+        Removes one or many previously inserted rows from the aggregates
+
+        Args:
+            department (ArrayLike): department id of each row
+            man (ArrayLike): man salary of each row
+            female (ArrayLike): female salary of each row
+        """
+        self._accumulate(department, man, female, -1)
+
+    def update(
+        self,
+        department: ArrayLike,
+        old: Tuple[ArrayLike, ArrayLike],
+        new: Tuple[ArrayLike, ArrayLike]
+        ) -> None:
+        """
+        Replaces the salaries of existing rows
+
+        Args:
+            department (ArrayLike): department id of each row
+            old (Tuple[ArrayLike, ArrayLike]): previous (man, female) salaries
+            new (Tuple[ArrayLike, ArrayLike]): new (man, female) salaries
+        """
+        self.remove(department, *old)
+        self.insert(department, *new)
+
+    def _accumulate(
+        self,
+        department: ArrayLike,
+        man: ArrayLike,
+        female: ArrayLike,
+        sign: int
+        ) -> None:
+        """
+        Adds (sign=1) or subtracts (sign=-1) rows from the aggregates
+
+        Args:
+            department, man, female (ArrayLike): rows to accumulate
+            sign (int): +1 to insert, -1 to remove
+        """
+        department = np.atleast_1d(np.asarray(department, dtype=np.int64))
+        man = np.atleast_1d(np.asarray(man, dtype=np.int64))
+        female = np.atleast_1d(np.asarray(female, dtype=np.int64))
+        if len(department) == 0:
+            return
+        if department.min() >= 0 and department.max() < 2 ** 20:
+            # Small non-negative ids (the usual case) are their own bin
+            keys = department
+            unique = np.flatnonzero(np.bincount(keys))
+        else:
+            unique, keys = np.unique(department, return_inverse=True)
+        count = np.bincount(keys)
+        man_sum = np.rint(np.bincount(keys, weights=man)).astype(np.int64)
+        female_sum = np.rint(np.bincount(keys, weights=female)).astype(np.int64)
+        if len(count) > len(unique):
+            count, man_sum, female_sum = count[unique], man_sum[unique], female_sum[unique]
+
+        slots = np.array([self._slot(int(d)) for d in unique])
+        self._man[slots] += sign * man_sum
+        self._female[slots] += sign * female_sum
+        self._count[slots] += sign * count
+
+    def totals(self, department: int) -> Tuple[int, int, int]:
+        """
+        Looks up the aggregates of a department
+
+        Args:
+            department (int): department id
+
+        Returns:
+            Tuple[int, int, int]: total man salary, total female salary and rows
+        """
+        slot = self._slots.get(department)
+        if slot is None:
+            raise KeyError(f"Unknown department {department}")
+        return int(self._man[slot]), int(self._female[slot]), int(self._count[slot])
+
+    def gap(self, department: int) -> int:
+        """
+        Returns the difference between the total man and female salaries
+
+        Args:
+            department (int): department id
+
+        Returns:
+            int: man total minus female total
+        """
+        man, female, _ = self.totals(department)
+        return man - female
+
+    def _select(self, mask_fn: Callable[[np.ndarray], np.ndarray]) -> List[int]:
+        """
+        Returns the non-empty departments whose absolute pay gap satisfies mask_fn
+
+        Args:
+            mask_fn (Callable): maps the array of absolute gaps to a boolean mask
+
+        Returns:
+            List[int]: sorted matching departments
+        """
+        n = len(self._slots)
+        gaps = np.abs(self._man[:n] - self._female[:n])
+        mask = mask_fn(gaps) & (self._count[:n] > 0)
+        return sorted(self._departments[:n][mask].tolist())
+
+    def equal_pay_departments(self) -> List[int]:
+        """
+        Finds the departments with equal pay
+
+        Returns:
+            List[int]: sorted departments where both totals match
+        """
+        return self._select(lambda gaps: gaps == 0)
+
+    def gap_above(self, threshold: int) -> List[int]:
+        """
+        Finds the departments whose absolute pay gap exceeds a threshold
+
+        Args:
+            threshold (int): salary gap threshold
+
+        Returns:
+            List[int]: sorted departments with a gap strictly above threshold
+        """
+        return self._select(lambda gaps: gaps > threshold)
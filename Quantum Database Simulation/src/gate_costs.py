@@ -0,0 +1,292 @@
+"""
+Module to explore the cost of multi-controlled X (CCX/MCX) constructions. Every
+(number of controls, strategy, basis) decomposition is transpiled once and
+memoized, and its CX count, T-count and depth are tabulated so that the circuit
+builders of src/quantum_circuit.py can pick the cheapest construction
+
+Strategies:
+    "noancilla": Gray-code multi-controlled phase, no ancillas
+    "recursion": recursive split, one clean ancilla above four controls
+    "v-chain": Toffoli chain over n - 2 clean ancillas
+    "v-chain-dirty": Toffoli chain over n - 2 ancillas in any state
+    "relative-phase": chain of relative-phase Toffolis (RCCX/RC3X). Correct only
+        up to a diagonal phase, so it may replace an MCX only where the gate is
+        later uncomputed, as in the QuantumDatabase gate and its inverse
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+from numpy import pi, isclose
+from qiskit import QuantumCircuit, QuantumRegister, transpile
+
+STRATEGIES: Tuple[str, ...] = ("noancilla", "recursion", "v-chain", "v-chain-dirty", "relative-phase")
+EXACT_STRATEGIES: Tuple[str, ...] = ("noancilla", "recursion", "v-chain", "v-chain-dirty")
+METRICS: Tuple[str, ...] = ("cx", "t", "depth")
+BASES: Dict[str, Tuple[str, ...]] = {
+    "cx-u": ("cx", "u"),
+    "clifford+t": ("cx", "h", "s", "sdg", "t", "tdg", "x", "rz")
+}
+
+
+def ancillas(n_controls: int, strategy: str) -> int:
+    """
+    Number of ancilla qubits a strategy needs
+
+    Args:
+        n_controls (int): number of controls
+        strategy (str): one of STRATEGIES
+
+    Returns:
+        int: ancilla qubits
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}', expected one of {STRATEGIES}")
+    if strategy == "recursion":
+        return 1 if n_controls > 4 else 0
+    if strategy == "relative-phase":
+        return max(0, n_controls - 3)
+    if strategy in ("v-chain", "v-chain-dirty"):
+        return max(0, n_controls - 2)
+    return 0
+
+
+def _relative_phase_mcx(
+    qc: QuantumCircuit,
+    controls: Sequence,
+    target,
+    ancilla: Sequence
+) -> None:
+    """
+    Appends a relative-phase MCX: RCCX chain into the ancillas, RC3X onto the
+    target and the inverse chain
+
+    Args:
+        qc (QuantumCircuit): circuit to extend
+        controls (Sequence): control qubits
+        target: target qubit
+        ancilla (Sequence): n - 3 clean ancilla qubits
+    """
+    n = len(controls)
+    if n == 1:
+        qc.cx(controls[0], target)
+        return
+    if n == 2:
+        qc.rccx(controls[0], controls[1], target)
+        return
+    chain = []
+    qubits = list(controls)
+    for k in range(n - 3):
+        chain.append((qubits[0], qubits[1], ancilla[k]))
+        qubits = [ancilla[k]] + qubits[2:]
+    for a, b, c in chain:
+        qc.rccx(a, b, c)
+    qc.rcccx(qubits[0], qubits[1], qubits[2], target)
+    for a, b, c in reversed(chain):
+        qc.rccx(a, b, c)
+
+
+@lru_cache(maxsize=None)
+def decomposition(n_controls: int, strategy: str, basis: str = "cx-u") -> QuantumCircuit:
+    """
+    Memoized decomposition of an MCX with n_controls controls. Qubits are the
+    controls, the target and then the ancillas. The cached circuit is shared:
+    copy it before modifying it
+
+    Args:
+        n_controls (int): number of controls
+        strategy (str): one of STRATEGIES
+        basis (str, optional): one of BASES. Defaults to "cx-u"
+
+    Returns:
+        QuantumCircuit: circuit transpiled to the basis
+    """
+    if basis not in BASES:
+        raise ValueError(f"Unknown basis '{basis}', expected one of {tuple(BASES)}")
+    controls = QuantumRegister(n_controls, name="control")
+    target = QuantumRegister(1, name="target")
+    registers = [controls, target]
+    n_ancillas = ancillas(n_controls, strategy)
+    if n_ancillas:
+        registers.append(QuantumRegister(n_ancillas, name="ancilla"))
+    qc = QuantumCircuit(*registers)
+    ancilla = list(registers[2]) if n_ancillas else []
+    if strategy == "relative-phase":
+        _relative_phase_mcx(qc, list(controls), target[0], ancilla)
+    elif n_controls <= 2 or strategy == "noancilla":
+        qc.mcx(list(controls), target[0], mode="noancilla")
+    else:
+        qc.mcx(list(controls), target[0], ancilla or None, mode=strategy)
+    return transpile(qc, basis_gates=list(BASES[basis]), optimization_level=1, seed_transpiler=0)
+
+
+def _t_count(qc: QuantumCircuit) -> Tuple[int, int]:
+    """
+    Counts the T gates of a circuit: T and Tdg, and RZ by odd multiples of pi/4.
+    Other non-Clifford RZ rotations are counted apart
+
+    Args:
+        qc (QuantumCircuit): circuit in a Clifford+T basis
+
+    Returns:
+        Tuple[int, int]: T-count and number of other non-Clifford rotations
+    """
+    t_count, rotations = 0, 0
+    for instruction in qc.data:
+        name = instruction.operation.name
+        if name in ("t", "tdg"):
+            t_count += 1
+        elif name == "rz":
+            angle = float(instruction.operation.params[0]) / (pi / 4)
+            if isclose(angle, round(angle)):
+                t_count += round(angle) % 2
+            else:
+                rotations += 1
+    return t_count, rotations
+
+
+@lru_cache(maxsize=None)
+def gate_cost(n_controls: int, strategy: str, basis: str = "cx-u") -> Dict[str, object]:
+    """
+    Memoized cost of an MCX decomposition
+
+    Args:
+        n_controls (int): number of controls
+        strategy (str): one of STRATEGIES
+        basis (str, optional): one of BASES. Defaults to "cx-u"
+
+    Returns:
+        Dict[str, object]: n_controls, strategy, basis, ancillas, exact, cx, t,
+            rotations (non-Clifford RZ other than T), depth and size
+    """
+    qc = decomposition(n_controls, strategy, basis)
+    t_count, rotations = _t_count(decomposition(n_controls, strategy, "clifford+t"))
+    return {
+        "n_controls": n_controls,
+        "strategy": strategy,
+        "basis": basis,
+        "ancillas": ancillas(n_controls, strategy),
+        "exact": strategy in EXACT_STRATEGIES,
+        "cx": qc.count_ops().get("cx", 0),
+        "t": t_count,
+        "rotations": rotations,
+        "depth": qc.depth(),
+        "size": qc.size()
+    }
+
+
+def cost_table(
+    max_controls: int = 8,
+    strategies: Sequence[str] = STRATEGIES,
+    basis: str = "cx-u"
+) -> List[Dict[str, object]]:
+    """
+    Tabulates the cost of every strategy for 1 to max_controls controls
+
+    Args:
+        max_controls (int, optional): largest number of controls. Defaults to 8
+        strategies (Sequence[str], optional): strategies to compare. Defaults to STRATEGIES
+        basis (str, optional): one of BASES. Defaults to "cx-u"
+
+    Returns:
+        List[Dict[str, object]]: one row per (n_controls, strategy), see gate_cost
+    """
+    return [
+        gate_cost(n, strategy, basis)
+        for n in range(1, max_controls + 1)
+        for strategy in strategies
+    ]
+
+
+def cheapest(
+    n_controls: int,
+    metric: str = "cx",
+    basis: str = "cx-u",
+    max_ancillas: int = 0,
+    exact: bool = True
+) -> Optional[Dict[str, object]]:
+    """
+    Cheapest MCX construction under the available ancillas, ties broken by
+    CX count and depth. With metric "t", constructions with fewer non-Clifford
+    rotations other than T come first, since those cost many T gates each once
+    synthesized
+
+    Args:
+        n_controls (int): number of controls
+        metric (str, optional): one of METRICS. Defaults to "cx"
+        basis (str, optional): one of BASES. Defaults to "cx-u"
+        max_ancillas (int, optional): ancilla qubits available. Defaults to 0
+        exact (bool, optional): exclude relative-phase constructions. Defaults to True
+
+    Returns:
+        Dict[str, object]: row of the cheapest construction, see gate_cost
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+    strategies = EXACT_STRATEGIES if exact else STRATEGIES
+    rows = [
+        gate_cost(n_controls, strategy, basis)
+        for strategy in strategies
+        if ancillas(n_controls, strategy) <= max_ancillas
+    ]
+    if metric == "t":
+        return min(rows, key=lambda row: (row["rotations"], row["t"], row["cx"], row["depth"]))
+    return min(rows, key=lambda row: (row[metric], row["cx"], row["depth"]))
+
+
+def append_mcx(
+    qc: QuantumCircuit,
+    controls: Sequence,
+    target,
+    strategy: str = "noancilla",
+    ancilla: Sequence = ()
+) -> None:
+    """
+    Appends an MCX built with a given strategy to a circuit
+
+    Args:
+        qc (QuantumCircuit): circuit to extend
+        controls (Sequence): control qubits
+        target: target qubit
+        strategy (str, optional): one of STRATEGIES. Defaults to "noancilla"
+        ancilla (Sequence, optional): ancilla qubits, at least
+            ancillas(len(controls), strategy). Defaults to ()
+    """
+    n_ancillas = ancillas(len(controls), strategy)
+    if len(ancilla) < n_ancillas:
+        raise ValueError(
+            f"Strategy '{strategy}' needs {n_ancillas} ancillas for "
+            f"{len(controls)} controls, got {len(ancilla)}")
+    if strategy == "relative-phase":
+        _relative_phase_mcx(qc, list(controls), target, list(ancilla))
+    elif len(controls) <= 2 or strategy == "noancilla":
+        qc.mcx(list(controls), target, mode="noancilla")
+    else:
+        qc.mcx(list(controls), target, list(ancilla[:n_ancillas]) or None, mode=strategy)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Cost table of multi-controlled X decompositions.")
+    parser.add_argument(
+        "--max_controls",
+        type=int,
+        default=8,
+        help="Largest number of controls (default value: 8)"
+    )
+    parser.add_argument(
+        "--basis",
+        choices=list(BASES),
+        default="cx-u",
+        help="Target basis of the CX count and depth (default value: cx-u)"
+    )
+    args = parser.parse_args()
+    print(f"{'n':>3} {'strategy':>15} {'ancillas':>8} {'exact':>6} {'cx':>6} "
+          f"{'t':>6} {'rot':>6} {'depth':>6}")
+    for row in cost_table(args.max_controls, basis=args.basis):
+        print(f"{row['n_controls']:>3} {row['strategy']:>15} {row['ancillas']:>8} "
+              f"{str(row['exact']):>6} {row['cx']:>6} {row['t']:>6} "
+              f"{row['rotations']:>6} {row['depth']:>6}")
@@ -0,0 +1,251 @@
+"""
+Module to simulate the Quantum Database under noise. Every gate of the circuit,
+transpiled to CX and single-qubit U gates, is followed by a depolarizing and an
+amplitude-damping channel, and every measurement is subject to a symmetric
+readout error. The strengths can be derived from the decay rates of the EIT
+memory (see eit_noise_strengths)
+
+Noisy circuits run either as Monte-Carlo trajectories of the statevector, split
+in batches of shots over a process pool, or as a single density-matrix
+simulation, whichever is cheaper for the number of qubits and shots. The rows of
+a sweep can be appended to a Parquet dataset as soon as each strength finishes
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import exp
+from typing import Dict, List, Optional, Sequence, Tuple
+from qiskit import QuantumCircuit, transpile
+from qiskit_aer import AerSimulator
+from qiskit_aer.noise import NoiseModel, ReadoutError, amplitude_damping_error, depolarizing_error
+from src.gate_costs import BASES
+from src.results_store import NOISE_SCHEMA, ResultsWriter, counts_columns
+
+NOISE_CHANNELS: Tuple[str, ...] = ("depolarizing", "amplitude_damping", "readout")
+METHODS: Tuple[str, ...] = ("auto", "statevector", "density_matrix")
+# Shots of every Monte-Carlo batch sent to a worker
+BATCH_SHOTS: int = 50
+# Largest density matrix simulated, in bytes (2^(2n) complex doubles)
+DENSITY_MATRIX_BUDGET: int = 2 ** 30
+
+Noise = Dict[str, float]
+
+
+def eit_noise_strengths(gamma: float, gamma_sg: float, gate_time: float, readout: float = 0.0) -> Noise:
+    """
+    Per-gate error probabilities of a qubit stored in the ground states of the
+    EIT Lambda system: spontaneous emission from the excited state, at rate
+    gamma, scrambles the qubit (depolarizing), and the decay of the metastable
+    state, at rate gamma_sg, relaxes it (amplitude damping)
+
+    Args:
+        gamma (float): Decay rate of the excited state
+        gamma_sg (float): Decay rate of the metastable state
+        gate_time (float): duration of a gate, in the time units of the rates
+        readout (float, optional): readout error probability. Defaults to 0
+
+    Returns:
+        Noise: strength of every channel of NOISE_CHANNELS
+    """
+    return {
+        "depolarizing": 1.0 - exp(-gamma * gate_time),
+        "amplitude_damping": 1.0 - exp(-gamma_sg * gate_time),
+        "readout": readout
+    }
+
+
+def build_noise_model(noise: Noise) -> NoiseModel:
+    """
+    Builds the noise model of the transpiled circuits
+
+    Args:
+        noise (Noise): strength of the channels in NOISE_CHANNELS; missing
+            channels are noiseless
+
+    Returns:
+        NoiseModel: depolarizing and amplitude damping after every U and CX gate,
+            and symmetric readout errors
+    """
+    unknown = set(noise) - set(NOISE_CHANNELS)
+    if unknown:
+        raise ValueError(f"Unknown noise channels {sorted(unknown)}, expected some of {NOISE_CHANNELS}")
+    p = noise.get("depolarizing", 0.0)
+    damping = noise.get("amplitude_damping", 0.0)
+    readout = noise.get("readout", 0.0)
+    model = NoiseModel(basis_gates=list(BASES["cx-u"]))
+    if p or damping:
+        single = depolarizing_error(p, 1).compose(amplitude_damping_error(damping))
+        double = depolarizing_error(p, 2).compose(
+            amplitude_damping_error(damping).tensor(amplitude_damping_error(damping)))
+        model.add_all_qubit_quantum_error(single, ["u"])
+        model.add_all_qubit_quantum_error(double, ["cx"])
+    if readout:
+        model.add_all_qubit_readout_error(ReadoutError([[1 - readout, readout], [readout, 1 - readout]]))
+    return model
+
+
+def choose_method(num_qubits: int, shots: int, budget: int = DENSITY_MATRIX_BUDGET) -> str:
+    """
+    Cheapest simulation method: a trajectory costs O(2^n) per gate and shot, a
+    density matrix O(4^n) per gate once for all shots, so the density matrix
+    wins when 2^n <= shots, as long as it fits in memory
+
+    Args:
+        num_qubits (int): qubits of the circuit
+        shots (int): number of shots
+        budget (int, optional): largest density matrix in bytes. Defaults to DENSITY_MATRIX_BUDGET
+
+    Returns:
+        str: "density_matrix" or "statevector"
+    """
+    if 2 ** num_qubits <= shots and 16 * 4 ** num_qubits <= budget:
+        return "density_matrix"
+    return "statevector"
+
+
+def _run_batch(qc: QuantumCircuit, noise: Noise, method: str, shots: int, seed: int) -> Dict[str, int]:
+    """
+    Runs one batch of shots in the current process
+
+    Args:
+        qc (QuantumCircuit): circuit transpiled to BASES["cx-u"]
+        noise (Noise): channel strengths
+        method (str): "statevector" or "density_matrix"
+        shots (int): shots of the batch
+        seed (int): seed of the simulator
+
+    Returns:
+        Dict[str, int]: measurement counts
+    """
+    # One thread per worker, the parallelism comes from the pool
+    backend = AerSimulator(
+        method=method,
+        noise_model=build_noise_model(noise),
+        max_parallel_threads=1,
+        seed_simulator=seed
+    )
+    return backend.run(qc, shots=shots).result().get_counts()
+
+
+def noise_sweep(
+    qc: QuantumCircuit,
+    target: str,
+    strengths: Sequence[float],
+    profile: Optional[Noise] = None,
+    shots: int = 1000,
+    method: str = "auto",
+    n_workers: Optional[int] = None,
+    batch_shots: int = BATCH_SHOTS,
+    seed: int = 0,
+    results_dir: Optional[str] = None
+) -> List[Dict[str, object]]:
+    """
+    Success probability of the query against the noise strength. The circuit
+    is transpiled once, and the trajectory batches of all noise strengths are
+    run in a single process pool
+
+    Args:
+        qc (QuantumCircuit): circuit of the query, e.g. from create_quantum_circuit
+        target (str): measured bitstring of the correct answer
+        strengths (Sequence[float]): noise strengths to scan
+        profile (Noise, optional): channel probabilities at strength 1, e.g.
+            from eit_noise_strengths. Defaults to 1 for every channel
+        shots (int, optional): shots per strength. Defaults to 1000
+        method (str, optional): one of METHODS; "auto" uses choose_method.
+            Defaults to "auto"
+        n_workers (int, optional): worker processes; None uses os.cpu_count(),
+            1 runs in the current process. Defaults to None
+        batch_shots (int, optional): shots per trajectory batch. Defaults to BATCH_SHOTS
+        seed (int, optional): seed of the first batch. Defaults to 0
+        results_dir (str, optional): Parquet dataset every row is appended to
+            as soon as its strength finishes. Defaults to None
+
+    Returns:
+        List[Dict[str, object]]: one row per strength with the strength, the
+            channel probabilities, the method, the counts, the success
+            probability and the seconds elapsed until the strength finished
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {METHODS}")
+    if profile is None:
+        profile = {channel: 1.0 for channel in NOISE_CHANNELS}
+    if method == "auto":
+        method = choose_method(qc.num_qubits, shots)
+    circuit = transpile(qc, basis_gates=list(BASES["cx-u"]), optimization_level=1, seed_transpiler=0)
+
+    # A density matrix gives all shots at once; trajectories are split in batches
+    batch = shots if method == "density_matrix" else batch_shots
+    noises = [
+        {channel: min(1.0, strength * value) for channel, value in profile.items()}
+        for strength in strengths
+    ]
+    jobs = [
+        (point, min(batch, shots - start))
+        for point in range(len(noises))
+        for start in range(0, shots, batch)
+    ]
+    seeds = [seed + k for k in range(len(jobs))]
+
+    rows = [
+        {"strength": strength, **noise, "method": method, "counts": {}}
+        for strength, noise in zip(strengths, noises)
+    ]
+    pending = [0] * len(rows)
+    for point, _ in jobs:
+        pending[point] += 1
+    writer = None
+    if results_dir is not None:
+        params = {
+            "circuit": circuit.qasm(), "target": target, "strengths": list(strengths),
+            "profile": profile, "shots": shots, "method": method,
+            "batch_shots": batch_shots, "seed": seed
+        }
+        # One part file per strength, so finished strengths can be queried at once
+        writer = ResultsWriter(results_dir, NOISE_SCHEMA, params, batch_rows=1)
+    started = time.perf_counter()
+
+    def collect(point: int, counts: Dict[str, int]) -> None:
+        row = rows[point]
+        for key, count in counts.items():
+            row["counts"][key] = row["counts"].get(key, 0) + count
+        pending[point] -= 1
+        if pending[point]:
+            return
+        row["success_probability"] = row["counts"].get(target, 0) / shots
+        row["elapsed_seconds"] = time.perf_counter() - started
+        if writer is not None:
+            writer.append({
+                "strength": row["strength"],
+                **{channel: row.get(channel, 0.0) for channel in NOISE_CHANNELS},
+                "method": method,
+                "shots": shots,
+                "target": target,
+                **counts_columns(row["counts"]),
+                "success_probability": row["success_probability"],
+                "elapsed_seconds": row["elapsed_seconds"]
+            })
+
+    # The rows of the strengths already finished are written even if a batch fails
+    try:
+        if n_workers == 1:
+            for (point, n_shots), job_seed in zip(jobs, seeds):
+                collect(point, _run_batch(circuit, noises[point], method, n_shots, job_seed))
+        else:
+            # Forking after Aer has started its OpenMP threads can deadlock the workers
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+                futures = [
+                    executor.submit(_run_batch, circuit, noises[point], method, n_shots, job_seed)
+                    for (point, n_shots), job_seed in zip(jobs, seeds)
+                ]
+                # Batches are collected in submission order, i.e. strength by strength
+                for (point, _), future in zip(jobs, futures):
+                    collect(point, future.result())
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
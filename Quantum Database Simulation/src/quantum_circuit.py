@@ -6,13 +6,43 @@ Date: 06/12/2024
 Version: 0.0.1
 """
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, Aer, execute
-from typing import List, Any
+from typing import List, Any, Optional
 from numpy import pi
+from src.gate_costs import EXACT_STRATEGIES, append_mcx, cheapest
+
+
+def resolve_mcx_strategy(
+    strategy: Optional[str],
+    n_controls: int,
+    exact: bool,
+    max_ancillas: int = 0
+) -> Optional[str]:
+    """
+    Resolves "auto" to the cheapest MCX strategy of src/gate_costs.py
+
+    Args:
+        strategy (Optional[str]): None (Qiskit default gate), "auto" or a strategy
+        n_controls (int): number of controls
+        exact (bool): whether relative-phase constructions are excluded
+        max_ancillas (int, optional): ancilla qubits available. Defaults to 0
+
+    Returns:
+        Optional[str]: the strategy to use
+
+    Raises:
+        ValueError: if exact is set and strategy gives relative phases
+    """
+    if strategy == "auto":
+        return cheapest(n_controls, max_ancillas=max_ancillas, exact=exact)["strategy"]
+    if exact and strategy is not None and strategy not in EXACT_STRATEGIES:
+        raise ValueError(f"Strategy '{strategy}' is not exact, expected one of {EXACT_STRATEGIES} or 'auto'")
+    return strategy
 
 def make_quantum_database_gate(
     address: QuantumRegister,
     data: QuantumRegister,
-    inputs: List[List[int]]
+    inputs: List[List[int]],
+    mcx_strategy: Optional[str] = None
     ) -> Any:
     """
     Creates a quantum database gate that maps input data based on address
@@ -21,10 +51,15 @@ def make_quantum_database_gate(
         address (QuantumRegister): quantum register for address qubits
         data (QuantumRegister): quantum register for data qubits
         inputs (List[List[int]]): list of input values to store in quantum database
+        mcx_strategy (str, optional): construction of the Toffoli gates, one of
+            src/gate_costs.STRATEGIES or "auto" for the cheapest one. The gate
+            is always uncomputed by its inverse, so relative-phase Toffolis are
+            allowed. Defaults to None (ccx)
 
     Returns:
         Any: returns a quantum gate representing the quantum database
     """
+    mcx_strategy = resolve_mcx_strategy(mcx_strategy, 2, exact=False)
     qc = QuantumCircuit(address, data)
     for indx in range(len(inputs)):
         binary_indx = bin(4 + indx)[-2:]
@@ -33,10 +68,13 @@ def make_quantum_database_gate(
 
         for j, value in enumerate(inputs[indx]):
             binary_value = bin(4 + value)[-2:]
-            qc.ccx(address[0], address[1], data[2 * j]
-                   ) if binary_value[0] == '1' else None
-            qc.ccx(address[0], address[1], data[2 * j + 1]
-                   ) if binary_value[1] == '1' else None
+            for bit, target in zip(binary_value, (data[2 * j], data[2 * j + 1])):
+                if bit != '1':
+                    continue
+                if mcx_strategy is None:
+                    qc.ccx(address[0], address[1], target)
+                else:
+                    append_mcx(qc, address[:2], target, mcx_strategy)
 
         [qc.x(address[i]) for i in range(2) if binary_indx[i] == '0']
     return qc.to_gate(label="QuantumDatabase")
@@ -107,31 +145,47 @@ def add_qubit(
         qc.cp(sign * pi / (2 ** (3 - indx)), data[q], qb)
 
 
-def data_validator_gate(output: QuantumRegister) -> Any:
+def data_validator_gate(output: QuantumRegister, mcx_strategy: Optional[str] = None) -> Any:
     """
     Create a data validator or oracle gate
 
     Args:
         output (QuantumRegister): quantum register for result qubits
+        mcx_strategy (str, optional): construction of the multi-controlled
+            Toffoli, one of src/gate_costs.EXACT_STRATEGIES without ancillas or
+            "auto" for the cheapest one. Defaults to None (mct)
 
     Returns:
         Any: quantum gate representing the data validator
     """
+    mcx_strategy = resolve_mcx_strategy(mcx_strategy, len(output) - 1, exact=True)
     qc = QuantumCircuit(output)
     qc.x(output)
     qc.h(output[-1])
-    qc.mct(output[:-1], output[-1])
+    if mcx_strategy is None:
+        qc.mct(output[:-1], output[-1])
+    else:
+        append_mcx(qc, output[:-1], output[-1], mcx_strategy)
     qc.h(output[-1])
     qc.x(output)
     return qc.to_gate(label="DataValidator")
 
 
-def create_quantum_circuit(inputs: List[List[int]]) -> QuantumCircuit:
+def create_quantum_circuit(
+    inputs: List[List[int]],
+    mcx_strategy: Optional[str] = None,
+    oracle_mcx_strategy: Optional[str] = None
+    ) -> QuantumCircuit:
     """
     Constructs the main quantum circuit for querying and validating the database
 
     Args:
         inputs (List[List[int]]): The normalized inputs for the database
+        mcx_strategy (str, optional): construction of the Toffoli gates of the
+            database, see make_quantum_database_gate. Defaults to None (Qiskit gates)
+        oracle_mcx_strategy (str, optional): construction of the MCX of the
+            oracle, which must be exact, see data_validator_gate. Defaults to
+            None (same as mcx_strategy)
 
     Returns:
         QuantumCircuit: The complete quantum circuit
@@ -144,15 +198,17 @@ def create_quantum_circuit(inputs: List[List[int]]) -> QuantumCircuit:
 
     qc.h(address)
 
-    qc.append(make_quantum_database_gate(address, data, inputs), address[:] + data[:])
+    qc.append(make_quantum_database_gate(address, data, inputs, mcx_strategy), address[:] + data[:])
     qc.append(data_processor_gate(data, output), data[:] + output[:])
-    qc.append(data_validator_gate(output), output[:])
+    if oracle_mcx_strategy is None:
+        oracle_mcx_strategy = mcx_strategy
+    qc.append(data_validator_gate(output, oracle_mcx_strategy), output[:])
 
     processor_inverse_gate = data_processor_gate(data, output).inverse()
     processor_inverse_gate.name = "DataProcessor Inverse"
     qc.append(processor_inverse_gate, data[:] + output[:])
 
-    database_inverse_gate = make_quantum_database_gate(address, data, inputs).inverse()
+    database_inverse_gate = make_quantum_database_gate(address, data, inputs, mcx_strategy).inverse()
     database_inverse_gate.name = "QuantumDatabase Inverse"
     qc.append(database_inverse_gate, address[:] + data[:])
 
@@ -169,17 +225,18 @@ def create_quantum_circuit(inputs: List[List[int]]) -> QuantumCircuit:
 
 
 
-def simulate_circuit(qc: QuantumCircuit) -> dict:
+def simulate_circuit(qc: QuantumCircuit, shots: int = 1000) -> dict:
     """
     Simulates the quantum circuit using the QASM simulator
 
     Args:
         qc (QuantumCircuit): the quantum circuit to simulate
+        shots (int, optional): number of shots. Defaults to 1000
 
     Returns:
         dict: a dictionary of measurement results with counts
     """
     backend = Aer.get_backend('qasm_simulator')
-    job = execute(qc, backend, shots=1000)
+    job = execute(qc, backend, shots=shots)
     result = job.result()
     return result.get_counts()
@@ -0,0 +1,222 @@
+"""
+Module to export the results of the Quantum Database simulations to append-only
+Parquet datasets: the measurement counts of every query run by main.py and the
+success probabilities of the noise sweeps of src/noise.py
+
+A dataset is a directory of Parquet part files sharing one schema. Rows are
+buffered and written as a new part file every batch_rows rows, so a sweep that
+runs for hours can already be queried with pyarrow.dataset and never keeps all
+its rows in memory. Parts are written under a hidden name and renamed when
+complete. Every row records the run id, the time, the git commit, a hash of the
+source code and a hash of the parameters of its run
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import hashlib
+import json
+import os
+import subprocess
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# Rows buffered before a part file is written
+BATCH_ROWS: int = 1000
+# Default dataset of the queries run by main.py
+RESULTS_DIR: str = "results/queries"
+
+PROJECT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROVENANCE_SCHEMA: pa.Schema = pa.schema([
+    ("run_id", pa.string()),
+    ("timestamp", pa.timestamp("us", tz="UTC")),
+    ("git_commit", pa.string()),
+    ("code_hash", pa.string()),
+    ("params_hash", pa.string())
+])
+
+# One row per query of main.py
+QUERY_SCHEMA: pa.Schema = pa.schema([
+    ("mode", pa.string()),
+    ("equal_department", pa.int64()),
+    ("departments", pa.int64()),
+    ("shots", pa.int64()),
+    ("outcomes", pa.list_(pa.string())),
+    ("counts", pa.list_(pa.int64())),
+    ("found", pa.list_(pa.int64())),
+    ("build_seconds", pa.float64()),
+    ("simulate_seconds", pa.float64())
+])
+
+# One row per noise strength of src/noise.noise_sweep
+NOISE_SCHEMA: pa.Schema = pa.schema([
+    ("strength", pa.float64()),
+    ("depolarizing", pa.float64()),
+    ("amplitude_damping", pa.float64()),
+    ("readout", pa.float64()),
+    ("method", pa.string()),
+    ("shots", pa.int64()),
+    ("target", pa.string()),
+    ("outcomes", pa.list_(pa.string())),
+    ("counts", pa.list_(pa.int64())),
+    ("success_probability", pa.float64()),
+    ("elapsed_seconds", pa.float64())
+])
+
+
+@lru_cache(maxsize=None)
+def git_commit() -> str:
+    """
+    Commit of the working tree
+
+    Returns:
+        str: hexadecimal commit hash, "unknown" outside a git repository
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
+
+
+@lru_cache(maxsize=None)
+def code_hash() -> str:
+    """
+    SHA-256 of the Python sources of the project, so runs of uncommitted
+    changes are told apart
+
+    Returns:
+        str: hexadecimal digest
+    """
+    digest = hashlib.sha256()
+    for folder, dirs, files in sorted(os.walk(PROJECT_DIR)):
+        dirs[:] = sorted(d for d in dirs if not d.startswith((".", "__")))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(folder, name)
+                digest.update(os.path.relpath(path, PROJECT_DIR).encode())
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def params_hash(params: Dict[str, Any]) -> str:
+    """
+    SHA-256 of the parameters of a run
+
+    Args:
+        params (Dict[str, Any]): JSON-serializable parameters; other values are
+            hashed by their string representation
+
+    Returns:
+        str: hexadecimal digest
+    """
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def counts_columns(counts: Dict[str, int]) -> Dict[str, List]:
+    """
+    Splits measurement counts into the outcomes and counts list columns
+
+    Args:
+        counts (Dict[str, int]): measurement counts
+
+    Returns:
+        Dict[str, List]: sorted outcomes and their counts
+    """
+    outcomes = sorted(counts)
+    return {"outcomes": outcomes, "counts": [int(counts[outcome]) for outcome in outcomes]}
+
+
+class ResultsWriter:
+    """
+    Buffered writer of an append-only Parquet dataset, to be used as a context
+    manager so the last rows are written on exit
+    """
+
+    def __init__(
+        self,
+        dataset_dir: str,
+        schema: pa.Schema,
+        params: Dict[str, Any],
+        batch_rows: int = BATCH_ROWS
+    ):
+        """
+        Args:
+            dataset_dir (str): directory of the dataset
+            schema (pa.Schema): result columns, the provenance is added
+            params (Dict[str, Any]): parameters of the run, see params_hash
+            batch_rows (int, optional): rows per part file. Defaults to BATCH_ROWS
+        """
+        self.dataset_dir = dataset_dir
+        self.schema = pa.schema(list(PROVENANCE_SCHEMA) + list(schema))
+        self.batch_rows = batch_rows
+        self.run_id = uuid.uuid4().hex
+        self.provenance = {
+            "run_id": self.run_id,
+            "git_commit": git_commit(),
+            "code_hash": code_hash(),
+            "params_hash": params_hash(params)
+        }
+        self._rows: List[Dict[str, Any]] = []
+        self._parts = 0
+        os.makedirs(dataset_dir, exist_ok=True)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """
+        Buffers a row, writing a part file once batch_rows rows are buffered
+
+        Args:
+            row (Dict[str, Any]): value of every column of the schema given to
+                the constructor
+        """
+        self._rows.append({**self.provenance, "timestamp": datetime.now(timezone.utc), **row})
+        if len(self._rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows as a new part file
+        """
+        if not self._rows:
+            return
+        name = f"part-{self.run_id}-{self._parts:05d}.parquet"
+        # Hidden files are skipped by pyarrow.dataset until they are renamed
+        tmp = os.path.join(self.dataset_dir, f".{name}")
+        pq.write_table(pa.Table.from_pylist(self._rows, schema=self.schema), tmp)
+        os.replace(tmp, os.path.join(self.dataset_dir, name))
+        self._rows = []
+        self._parts += 1
+
+    def close(self) -> None:
+        """
+        Writes the remaining rows
+        """
+        self.flush()
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_results(dataset_dir: str) -> ds.Dataset:
+    """
+    Opens a results dataset, including the parts of runs still in progress
+
+    Args:
+        dataset_dir (str): directory of the dataset
+
+    Returns:
+        pyarrow.dataset.Dataset: lazily scanned dataset, e.g.
+            read_results(path).to_table(filter=ds.field("strength") <= 0.01)
+    """
+    return ds.dataset(dataset_dir, format="parquet")
@@ -0,0 +1,244 @@
+"""
+This module generates large synthetic salary datasets for benchmarking the
+classical and quantum query paths. Every chunk of rows draws from its own
+independent NumPy Generator stream, so the output is reproducible no matter
+how many worker processes are used
+
+Author: Ricard Santiago Raigada García
+Date: 19/10/2026
+Version: 0.0.1
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+COLUMNS: Dict[str, type] = {
+    "man": np.int32,
+    "female": np.int32,
+    "department": np.int32
+}
+SALARY_DISTRIBUTIONS: Tuple[str, ...] = ("uniform", "normal", "lognormal")
+
+
+def _draw_salaries(
+    rng: np.random.Generator,
+    size: int,
+    distribution: str,
+    salary_range: Tuple[int, int]
+    ) -> np.ndarray:
+    """
+    Draws integer salaries inside salary_range from the given distribution
+
+    Args:
+        rng (np.random.Generator): random stream of the chunk
+        size (int): number of salaries to draw
+        distribution (str): one of SALARY_DISTRIBUTIONS
+        salary_range (Tuple[int, int]): half-open range [low, high) of salaries
+
+    Returns:
+        np.ndarray: salaries as int32
+    """
+    low, high = salary_range
+    if distribution == "uniform":
+        return rng.integers(low, high, size, dtype=np.int32)
+    mean = (low + high) / 2
+    if distribution == "normal":
+        values = rng.normal(mean, (high - low) / 6, size)
+    else:
+        values = rng.lognormal(np.log(mean), 0.25, size)
+    return np.clip(np.rint(values), low, high - 1).astype(np.int32)
+
+
+def _fill_chunk(
+    columns: Dict[str, np.ndarray],
+    start: int,
+    stop: int,
+    seed_sequence: np.random.SeedSequence,
+    n_departments: int,
+    equal_departments: Sequence[int],
+    distribution: str,
+    salary_range: Tuple[int, int]
+    ) -> None:
+    """
+    Generates rows [start, stop) and writes them into the given columns
+
+    Args:
+        columns (Dict[str, np.ndarray]): output columns, indexed by global row
+        start (int): first row of the chunk
+        stop (int): row after the last one of the chunk
+        seed_sequence (np.random.SeedSequence): seed of this chunk's stream
+        n_departments (int): number of departments
+        equal_departments (Sequence[int]): departments with enforced equal pay
+        distribution (str): salary distribution
+        salary_range (Tuple[int, int]): half-open range [low, high) of salaries
+    """
+    rng = np.random.default_rng(seed_sequence)
+    size = stop - start
+    # Departments are tiled over the rows, as in generate_normalized_inputs
+    department = (np.arange(start, stop, dtype=np.int64) % n_departments + 1).astype(np.int32)
+    man = _draw_salaries(rng, size, distribution, salary_range)
+    female = _draw_salaries(rng, size, distribution, salary_range)
+
+    equal = np.isin(department, equal_departments)
+    female[equal] = man[equal]
+
+    columns["man"][start:stop] = man
+    columns["female"][start:stop] = female
+    columns["department"][start:stop] = department
+
+
+def _fill_chunk_on_disk(
+    output_dir: str,
+    start: int,
+    stop: int,
+    seed_sequence: np.random.SeedSequence,
+    n_departments: int,
+    equal_departments: Sequence[int],
+    distribution: str,
+    salary_range: Tuple[int, int]
+    ) -> None:
+    """
+    Worker entry point: opens the memory-mapped columns and fills one chunk
+
+    Args:
+        output_dir (str): directory holding the column files
+        start, stop, seed_sequence, n_departments, equal_departments,
+        distribution, salary_range: see _fill_chunk
+    """
+    columns = {
+        name: np.load(os.path.join(output_dir, f"{name}.npy"), mmap_mode="r+")
+        for name in COLUMNS
+    }
+    _fill_chunk(
+        columns,
+        start,
+        stop,
+        seed_sequence,
+        n_departments,
+        equal_departments,
+        distribution,
+        salary_range
+    )
+    for column in columns.values():
+        column.flush()
+
+
+def generate_synthetic_payroll(
+    n_employees: int = 12,
+    n_departments: int = 4,
+    equal_departments: Sequence[int] = (2,),
+    distribution: str = "uniform",
+    salary_range: Tuple[int, int] = (1000, 5000),
+    seed: int = 42,
+    chunk_size: int = 1_000_000,
+    n_workers: Optional[int] = None,
+    output_dir: Optional[str] = None
+    ) -> Tuple[Dict[str, np.ndarray], List[int]]:
+    """
+    Generate a columnar synthetic salary dataset. Each row pairs a man and a
+    female salary within a department, following generate_normalized_inputs
+
+    The rows are split into chunks of chunk_size and chunk i always uses the
+    i-th child of SeedSequence(seed), so the dataset only depends on the
+    parameters and not on the number of workers. When output_dir is given the
+    columns are written to memory-mapped .npy files by a process pool,
+    otherwise they are generated in memory in the current process
+
+    Args:
+        n_employees (int, optional): number of rows. Defaults to 12
+        n_departments (int, optional): number of departments. Defaults to 4
+        equal_departments (Sequence[int], optional): departments (1-based) with
+            enforced equal pay. Defaults to (2,)
+        distribution (str, optional): salary distribution, one of
+            SALARY_DISTRIBUTIONS. Defaults to "uniform"
+        salary_range (Tuple[int, int], optional): half-open range of salaries.
+            Defaults to (1000, 5000)
+        seed (int, optional): root seed of all the streams. Defaults to 42
+        chunk_size (int, optional): rows per chunk. Defaults to 1_000_000
+        n_workers (int, optional): worker processes when writing to disk.
+            Defaults to os.cpu_count()
+        output_dir (str, optional): directory for the memory-mapped columns.
+            Defaults to None (in memory)
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], List[int]]:
+            columns "man", "female" and "department"
+            list of departments with enforced equal pay
+    """
+    if distribution not in SALARY_DISTRIBUTIONS:
+        raise ValueError(
+            f"Unknown distribution '{distribution}', "
+            f"expected one of {SALARY_DISTRIBUTIONS}")
+    equal_departments = sorted(set(int(d) for d in equal_departments))
+    if any(d < 1 or d > n_departments for d in equal_departments):
+        raise ValueError(
+            f"Equal departments must be between 1 and {n_departments}")
+
+    bounds = list(range(0, n_employees, chunk_size)) + [n_employees]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(bounds) - 1)
+    chunk_args = [
+        (start, stop, seed_sequence, n_departments, equal_departments,
+         distribution, tuple(salary_range))
+        for start, stop, seed_sequence in zip(bounds[:-1], bounds[1:], seed_sequences)
+    ]
+
+    if output_dir is None:
+        columns = {
+            name: np.empty(n_employees, dtype=dtype)
+            for name, dtype in COLUMNS.items()
+        }
+        for args in chunk_args:
+            _fill_chunk(columns, *args)
+        return columns, equal_departments
+
+    os.makedirs(output_dir, exist_ok=True)
+    for name, dtype in COLUMNS.items():
+        np.lib.format.open_memmap(
+            os.path.join(output_dir, f"{name}.npy"),
+            mode="w+",
+            dtype=dtype,
+            shape=(n_employees,)
+        ).flush()
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(_fill_chunk_on_disk, output_dir, *args)
+            for args in chunk_args
+        ]
+        for future in futures:
+            future.result()
+
+    with open(os.path.join(output_dir, "metadata.json"), "w") as f:
+        json.dump({
+            "n_employees": n_employees,
+            "n_departments": n_departments,
+            "equal_departments": equal_departments,
+            "distribution": distribution,
+            "salary_range": list(salary_range),
+            "seed": seed,
+            "chunk_size": chunk_size
+        }, f, indent=2)
+    return load_synthetic_payroll(output_dir)
+
+
+def load_synthetic_payroll(output_dir: str) -> Tuple[Dict[str, np.ndarray], List[int]]:
+    """
+    Loads a dataset written by generate_synthetic_payroll as read-only memory maps
+
+    Args:
+        output_dir (str): directory holding the column files
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], List[int]]:
+            memory-mapped columns "man", "female" and "department"
+            list of departments with enforced equal pay
+    """
+    with open(os.path.join(output_dir, "metadata.json")) as f:
+        metadata = json.load(f)
+    columns = {
+        name: np.load(os.path.join(output_dir, f"{name}.npy"), mmap_mode="r")
+        for name in COLUMNS
+    }
+    return columns, metadata["equal_departments"]
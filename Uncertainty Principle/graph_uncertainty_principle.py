@@ -1,13 +1,33 @@
 """
 This module generates a graph of the uncertainty principle.
 
+Besides the original contour plot, the "raster" mode evaluates the surface
+Z = delta_x * delta_p - bound as an outer product in float32, never building
+meshgrid arrays, and draws it with imshow at the resolution of the figure, with
+optional contour lines on top. Grids larger than the figure (poster renders of
+20k x 20k points) are written as image tiles, each computed within a fixed
+memory budget.
+
 Author: Ricard Santiago Raigada García
 Date: 06/12/2024
 Version: 0.0.1
 """
+import argparse
+import os
+from typing import Iterator, List, Optional, Tuple
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Physical constants
+H: float = 6.62607015e-34
+HBAR: float = H / (2 * np.pi)
+
+RENDER_MODES: Tuple[str, ...] = ("contourf", "raster")
+# Memory allowed for one tile, and bytes it takes per point: the float32 surface,
+# the float64 RGBA colors of the colormap and the uint8 RGBA image
+MEMORY_BUDGET: int = 256 * 2 ** 20
+BYTES_PER_POINT: int = 4 + 32 + 4
+
 
 def set_plot_style() -> None:
     """
@@ -30,41 +50,213 @@ def set_plot_style() -> None:
         'text.usetex': False
     })
 
-def main() -> None:
+def uncertainty_surface(
+    x: np.ndarray,
+    p: np.ndarray,
+    bound: float = HBAR / 2,
+    dtype: type = np.float32
+) -> np.ndarray:
+    """
+    Evaluates Z = |x| |p| - bound by outer-product broadcasting
+
+    Args:
+        x (np.ndarray): Position uncertainties, along the columns
+        p (np.ndarray): Momentum uncertainties, along the rows
+        bound (float, optional): Lower bound of the product. Defaults to hbar / 2
+        dtype (type, optional): Floating point type of Z. Defaults to np.float32
+
+    Returns:
+        np.ndarray: Z of shape (len(p), len(x))
+    """
+    Z = np.multiply.outer(np.abs(p).astype(dtype), np.abs(x).astype(dtype))
+    Z -= dtype(bound)
+    return Z
+
+
+def surface_range(x: np.ndarray, p: np.ndarray, bound: float = HBAR / 2) -> Tuple[float, float]:
+    """
+    Minimum and maximum of the surface, from the 1D axes only
+
+    Args:
+        x (np.ndarray): Position uncertainties
+        p (np.ndarray): Momentum uncertainties
+        bound (float, optional): Lower bound of the product. Defaults to hbar / 2
+
+    Returns:
+        Tuple[float, float]: vmin and vmax shared by every tile
+    """
+    ax, ap = np.abs(x), np.abs(p)
+    return float(ax.min() * ap.min() - bound), float(ax.max() * ap.max() - bound)
+
+
+def tile_slices(
+    n_rows: int,
+    n_cols: int,
+    budget: int = MEMORY_BUDGET
+) -> Iterator[Tuple[slice, slice]]:
+    """
+    Splits a grid in square tiles that fit in the memory budget
+
+    Args:
+        n_rows (int): Rows of the grid
+        n_cols (int): Columns of the grid
+        budget (int, optional): Bytes allowed per tile. Defaults to MEMORY_BUDGET
+
+    Yields:
+        Tuple[slice, slice]: Rows and columns of every tile
+    """
+    side = max(1, int(np.sqrt(budget / BYTES_PER_POINT)))
+    for row in range(0, n_rows, side):
+        for col in range(0, n_cols, side):
+            yield slice(row, row + side), slice(col, col + side)
+
+
+def render_tiles(
+    x: np.ndarray,
+    p: np.ndarray,
+    output_dir: str,
+    bound: float = HBAR / 2,
+    cmap: str = "inferno",
+    budget: int = MEMORY_BUDGET
+) -> List[str]:
+    """
+    Rasterizes the surface on the full grid as PNG tiles named after the pixel
+    row and column of their top-left corner, with the highest momentum on the
+    first row, all sharing one color scale
+
+    Args:
+        x (np.ndarray): Position uncertainties
+        p (np.ndarray): Momentum uncertainties
+        output_dir (str): Directory of the tiles
+        bound (float, optional): Lower bound of the product. Defaults to hbar / 2
+        cmap (str, optional): Colormap. Defaults to "inferno"
+        budget (int, optional): Bytes allowed per tile. Defaults to MEMORY_BUDGET
+
+    Returns:
+        List[str]: Paths of the tiles
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    vmin, vmax = surface_range(x, p, bound)
+    p_top_down = p[::-1]
+    paths = []
+    for rows, cols in tile_slices(len(p), len(x), budget):
+        path = os.path.join(output_dir, f"tile_{rows.start:06d}_{cols.start:06d}.png")
+        plt.imsave(
+            path,
+            uncertainty_surface(x[cols], p_top_down[rows], bound),
+            cmap=cmap,
+            vmin=vmin,
+            vmax=vmax)
+        paths.append(path)
+    return paths
+
+
+def plot_raster(
+    ax: plt.Axes,
+    x_range: Tuple[float, float],
+    p_range: Tuple[float, float],
+    n_points: int,
+    bound: float = HBAR / 2,
+    resolution: int = 2000,
+    contour_levels: Optional[int] = None,
+    cmap: str = "inferno"
+):
+    """
+    Draws the surface with imshow, evaluated at no more points per axis than
+    the figure can show, and optionally contour lines on top
+
+    Args:
+        ax (matplotlib.axes.Axes): The axes
+        x_range (Tuple[float, float]): Limits of the position axis
+        p_range (Tuple[float, float]): Limits of the momentum axis
+        n_points (int): Points per axis of the grid
+        bound (float, optional): Lower bound of the product. Defaults to hbar / 2
+        resolution (int, optional): Maximum points per axis that are drawn.
+            Defaults to 2000
+        contour_levels (int, optional): Number of contour lines. Defaults to None
+        cmap (str, optional): Colormap. Defaults to "inferno"
+
+    Returns:
+        matplotlib.image.AxesImage: The image, for the colorbar
+    """
+    n_drawn = min(n_points, resolution)
+    x = np.linspace(*x_range, n_drawn)
+    p = np.linspace(*p_range, n_drawn)
+    Z = uncertainty_surface(x, p, bound)
+    image = ax.imshow(
+        Z,
+        extent=(*x_range, *p_range),
+        origin="lower",
+        aspect="auto",
+        interpolation="nearest",
+        cmap=cmap,
+        alpha=0.8
+    )
+    if contour_levels:
+        ax.contour(x, p, Z, levels=contour_levels, colors="white", linewidths=0.5, alpha=0.6)
+    return image
+
+
+def main(
+    mode: str = "contourf",
+    n_points: int = 400,
+    bound: float = HBAR / 2,
+    contour_levels: Optional[int] = None,
+    output: Optional[str] = None,
+    tiles_dir: Optional[str] = None
+) -> None:
     """
     Main function to generate uncertainty principle plot
+
+    Args:
+        mode (str, optional): "contourf" or "raster". Defaults to "contourf"
+        n_points (int, optional): Points per axis of the grid. Defaults to 400
+        bound (float, optional): Lower bound of delta_x * delta_p. Defaults to hbar / 2
+        contour_levels (int, optional): Contour lines drawn over the raster.
+            Defaults to None
+        output (str, optional): Image file of the figure. Defaults to showing it
+        tiles_dir (str, optional): Also write the full-resolution raster as
+            tiles to this directory. Defaults to None
     """
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {RENDER_MODES}")
     # Params
-    h = 6.62607015e-34
-    hbar = h / (2 * np.pi)
-    x = np.linspace(-10, 10, 400)
-    p = np.linspace(-10, 10, 400)
-    X, P = np.meshgrid(x, p)
-    delta_x = np.abs(X)
-    delta_p = np.abs(P)
-    Z = delta_x * delta_p - hbar / 2
+    x_range = (-10, 10)
+    p_range = (-10, 10)
+    if bound == HBAR / 2:
+        bound_label, title_bound = r'\frac{\hbar}{2}', r'\frac{h}{4\pi}'
+    else:
+        bound_label = title_bound = f'{bound:.3g}'
     set_plot_style()
 
-    plt.figure(
+    fig, ax = plt.subplots(
         figsize=(8, 6)
         )
-    contour = plt.contourf(
-        X,
-        P,
-        Z,
-        levels=50,
-        cmap="inferno",
-        alpha=0.8
-        )
+    if mode == "contourf":
+        x = np.linspace(*x_range, n_points)
+        p = np.linspace(*p_range, n_points)
+        contour = ax.contourf(
+            x,
+            p,
+            uncertainty_surface(x, p, bound, dtype=np.float64),
+            levels=50,
+            cmap="inferno",
+            alpha=0.8
+            )
+    else:
+        contour = plot_raster(
+            ax, x_range, p_range, n_points, bound,
+            resolution=int(max(fig.get_size_inches()) * fig.dpi * 2),
+            contour_levels=contour_levels)
     cbar = plt.colorbar(contour)
     cbar.set_label(
-        r'$\Delta x \Delta p - \frac{\hbar}{2}$',
+        rf'$\Delta x \Delta p - {bound_label}$',
         fontsize=14,
         style='italic'
         )
 
     plt.title(
-        r'Uncertainty Principle: $\Delta x \Delta p \geq \frac{h}{4\pi}$',
+        rf'Uncertainty Principle: $\Delta x \Delta p \geq {title_bound}$',
         fontsize=18,
         style='italic'
         )
@@ -79,8 +271,57 @@ def main() -> None:
         style='italic'
         )
     plt.tight_layout()
-    plt.show()
+    if tiles_dir is not None:
+        render_tiles(
+            np.linspace(*x_range, n_points),
+            np.linspace(*p_range, n_points),
+            tiles_dir,
+            bound)
+    if output is None:
+        plt.show()
+    else:
+        fig.savefig(output)
+        plt.close(fig)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(
+        description="Uncertainty principle graph.")
+    parser.add_argument(
+        "--mode",
+        choices=RENDER_MODES,
+        default="contourf",
+        help="contourf (original plot) or raster (imshow, for large grids)"
+    )
+    parser.add_argument(
+        "--points",
+        type=int,
+        default=400,
+        help="Points per axis of the grid (default value: 400)"
+    )
+    parser.add_argument(
+        "--bound",
+        type=float,
+        default=HBAR / 2,
+        help="Lower bound of delta_x * delta_p (default value: hbar / 2)"
+    )
+    parser.add_argument(
+        "--contours",
+        type=int,
+        default=None,
+        help="Contour lines drawn over the raster"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Save the figure to this file instead of showing it"
+    )
+    parser.add_argument(
+        "--tiles_dir",
+        type=str,
+        default=None,
+        help="Write the full-resolution raster as PNG tiles to this directory"
+    )
+    args = parser.parse_args()
+    main(args.mode, args.points, args.bound, args.contours, args.output, args.tiles_dir)